@@ -0,0 +1,47 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled versions of utils.rpy_to_matrix / utils.normalize_angles.
+
+Optional: build in place with `cythonize -i _utils_ext.pyx`; utils falls back to numpy when absent.
+"""
+import numpy as np
+from libc.math cimport cos, sin, fmod, M_PI
+
+cdef double DEG2RAD = M_PI / 180.0
+
+
+def rpy_to_matrix(double roll, double pitch, double yaw):
+    """Rz(yaw) @ Ry(pitch) @ Rx(roll) for angles in degrees."""
+    cdef double ca = cos(roll * DEG2RAD), sa = sin(roll * DEG2RAD)
+    cdef double cb = cos(pitch * DEG2RAD), sb = sin(pitch * DEG2RAD)
+    cdef double cg = cos(yaw * DEG2RAD), sg = sin(yaw * DEG2RAD)
+    M = np.empty((3, 3))
+    cdef double[:, ::1] m = M
+    m[0, 0] = cg * cb
+    m[0, 1] = cg * sb * sa - sg * ca
+    m[0, 2] = cg * sb * ca + sg * sa
+    m[1, 0] = sg * cb
+    m[1, 1] = sg * sb * sa + cg * ca
+    m[1, 2] = sg * sb * ca - cg * sa
+    m[2, 0] = -sb
+    m[2, 1] = cb * sa
+    m[2, 2] = cb * ca
+    return M
+
+
+def normalize_angles(angles_deg):
+    """Wrap angles into [-180, 180). Arrays come back as arrays, any other sequence as a list."""
+    arr = np.ascontiguousarray(angles_deg, dtype=np.float64)
+    out = np.empty_like(arr)
+    cdef const double[::1] src = arr.reshape(-1)  # read-only inputs (e.g. MDH_ARRAYS) are accepted
+    cdef double[::1] dst = out.reshape(-1)
+    cdef Py_ssize_t i
+    cdef double v
+    for i in range(src.shape[0]):
+        # Same rounding as Python's float %: the remainder takes the divisor's sign
+        v = fmod(src[i] + 180.0, 360.0)
+        if v < 0.0:
+            v += 360.0
+        dst[i] = v - 180.0
+    if isinstance(angles_deg, np.ndarray):
+        return out
+    return out.tolist()
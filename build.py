@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 
 import PyInstaller.__main__
@@ -14,6 +15,14 @@ ICON_PATH = os.path.join("assets", ICON_FILE)
 SEPARATOR = ":" if sys.platform == "darwin" else ";"
 
 
+def compile_qt_resources():
+    """Compile resources.qrc into resources_rc.py so the splash icon ships as in-memory Qt resource data."""
+    subprocess.run(
+        [sys.executable, "-m", "PyQt5.pyrcc_main", "resources.qrc", "-o", "resources_rc.py"],
+        check=True,
+    )
+
+
 def create_windows_version_file():
     """Generate a temporary version file for Windows executable metadata."""
     v_parts = VERSION.split(".")
@@ -72,6 +81,7 @@ hidden_imports = [
     "visualizer",
     "config",
     "utils",
+    "resources_rc",
 ]
 
 args = [
@@ -99,6 +109,7 @@ elif sys.platform == "darwin":
     args.append(f"--osx-bundle-identifier={bundle_id}")
 
 print(f"Start build v{VERSION} by {AUTHOR}...")
+compile_qt_resources()
 try:
     PyInstaller.__main__.run(args)
 
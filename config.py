@@ -74,6 +74,8 @@ MODEL_DIR = os.path.join(PROJECT_ROOT, "model")
 VISUAL_DIR = os.path.join(MODEL_DIR, "visual")
 EXAMPLES_DIR = os.path.join(PROJECT_ROOT, "examples")
 ICON_PATH = os.path.join(PROJECT_ROOT, "assets", "icon.png")
+ICON_PATH_96 = os.path.join(PROJECT_ROOT, "assets", "icon_96.png")  # pre-scaled for the splash
+SPLASH_SHADOW_PATH = os.path.join(PROJECT_ROOT, "assets", "splash_shadow.png")  # baked card shadow
 HISTORY_FILE = os.path.join(USER_DATA_DIR, "recent_scripts.txt")
 STL_HISTORY_FILE = os.path.join(USER_DATA_DIR, "recent_stls.txt")
 
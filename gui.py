@@ -3,6 +3,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 import threading
 import queue
+import collections
 import socket
 import os
 import webbrowser
@@ -21,13 +22,14 @@ from urllib.request import urlretrieve, urlopen
 from visualizer import RobotVisualizer
 from robot_api import SimXArmAPI
 from config import GLOBAL_API_INSTANCE, JOINT_COUNT, HISTORY_FILE, STL_HISTORY_FILE, ROBOT_SCAN_PORT, GITHUB_URL, PORTFOLIO_URL
-from utils import QueueRedirector
 
 # --- GUI CONTEXT ---
 class AppContext:
     def __init__(self):
-        self.log_queue = queue.Queue()
-        self.joint_queue = queue.Queue(maxsize=2)
+        # Fed by SimXArmAPI._log from script/stream threads and by GUI handlers; drained by
+        # _process_queues every 30 ms. Only put/empty/get_nowait are used, so no Queue locking.
+        self.log_queue = queue.SimpleQueue()
+        self.joint_queue = collections.deque(maxlen=1)
         self.stop_flag = False
         self.paused = False
 
@@ -223,10 +225,10 @@ class ControlPanel(tk.Tk):
                 self.txt.see(tk.END)
             except queue.Empty: break
             
-        latest_joints = None
-        while not self.ctx.joint_queue.empty():
-            try: latest_joints = self.ctx.joint_queue.get_nowait()
-            except queue.Empty: break
+        try:
+            latest_joints = self.ctx.joint_queue.pop()
+        except IndexError:
+            latest_joints = None
         
         if latest_joints:
             with self.data_lock:
@@ -740,7 +742,7 @@ class ControlPanel(tk.Tk):
         self.ctx.log_queue.put("[GUI] Going home...")
         self.viz.clear_trace()
         self.api.joints_deg = [0.0] * JOINT_COUNT
-        self.ctx.joint_queue.put([0.0]*JOINT_COUNT)
+        self.ctx.joint_queue.append([0.0]*JOINT_COUNT)
         if self.api.real_arm:
             self.api.set_servo_angle([0]*6, speed=30, wait=False)
 
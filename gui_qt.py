@@ -3,22 +3,74 @@ import os
 import sys
 import threading
 import queue
+import collections
 import runpy
 import types
-import subprocess
 import socket
-from functools import partial
+from functools import partial, lru_cache, singledispatch
 import ast
-import json
+import re
 from datetime import datetime
+import numpy as np
 from PyQt5 import QtCore, QtWidgets, QtGui
 from pyvistaqt import QtInteractor
 
 import config
 from robot_api import SimXArmAPI
-from visualizer import RobotVisualizer
+from visualizer import RobotVisualizer, load_mesh
+from utils import json_loads, json_dumps
 
 # --- Qt styling helpers ---
+# Whole-app stylesheet, parsed once when applied to the QApplication; widgets opt in
+# to specific rules through their objectName rather than carrying their own sheet.
+GLOBAL_QSS = """
+QWidget { font-family: 'Segoe UI', 'Helvetica Neue', Arial; font-size: 10pt; color: #dfe3e8; }
+QGroupBox { font-weight: 600; border: 1px solid #2f2f2f; border-radius: 6px; margin-top: 8px; padding-top: 10px; background: #1f1f1f; }
+QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; color: #f08c28; }
+QFrame, QSplitter { background: #242424; }
+QSplitter::handle { background: #2f2f2f; }
+QPushButton { background-color: #2b2b2b; border: 1px solid #3a3a3a; border-radius: 4px; padding: 6px 10px; color: #e4e7ec; }
+QPushButton:hover { background-color: #333333; border-color: #f08c28; }
+QPushButton:pressed { background-color: #202020; border-color: #f08c28; }
+QPushButton:disabled { color: #6f7378; border-color: #2c2c2c; }
+QLineEdit, QComboBox, QTextEdit, QSpinBox, QDoubleSpinBox { background: #1a1a1a; border: 1px solid #2f2f2f; border-radius: 4px; padding: 4px; selection-background-color: #f08c28; selection-color: #0f0f0f; }
+QComboBox::drop-down { border: 0; width: 18px; }
+QSlider::groove:horizontal { height: 6px; background: #2c2c2c; border-radius: 3px; }
+QSlider::handle:horizontal { width: 14px; background: #f08c28; border: 1px solid #b96a1f; margin: -5px 0; border-radius: 7px; }
+QScrollBar { background: #1a1a1a; }
+QScrollBar::handle { background: #3c3c3c; border-radius: 5px; }
+QScrollBar::handle:hover { background: #505050; }
+QLabel { color: #dfe3e8; }
+QCheckBox { spacing: 6px; }
+QPushButton#CollapseHeader { border: none; background: transparent; color: #dfe3e8; padding: 3px 0; font-weight: 600; text-align: left; }
+QPushButton#CollapseHeader:hover, QPushButton#CollapseHeader:pressed { background: transparent; color: #f08c28; }
+QPushButton#CollapseHeader:focus { outline: none; }
+"""
+
+
+# Thin scrollbar for the controls column; the column is rebuilt by Refresh GUI.
+_LEFT_SCROLL_QSS = """
+QScrollArea { background: transparent; border: none; }
+QScrollArea > QWidget > QWidget { background: #242424; }
+QScrollBar:vertical {
+    background: transparent;
+    width: 9px;
+    margin: 4px 0 4px 0;
+}
+QScrollBar::handle:vertical {
+    background: #454545;
+    min-height: 24px;
+    border-radius: 5px;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+    background: none;
+}
+"""
+
+
 def apply_dark_palette(app: QtWidgets.QApplication):
     """Apply a night-mode palette and widget styling."""
     dark = QtGui.QPalette()
@@ -39,26 +91,17 @@ def apply_dark_palette(app: QtWidgets.QApplication):
     dark.setColor(QtGui.QPalette.Highlight, accent)
     dark.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
     app.setPalette(dark)
-    app.setStyleSheet("""
-        QWidget { font-family: 'Segoe UI', 'Helvetica Neue', Arial; font-size: 10pt; color: #dfe3e8; }
-        QGroupBox { font-weight: 600; border: 1px solid #2f2f2f; border-radius: 6px; margin-top: 8px; padding-top: 10px; background: #1f1f1f; }
-        QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; color: #f08c28; }
-        QFrame, QSplitter { background: #242424; }
-        QSplitter::handle { background: #2f2f2f; }
-        QPushButton { background-color: #2b2b2b; border: 1px solid #3a3a3a; border-radius: 4px; padding: 6px 10px; color: #e4e7ec; }
-        QPushButton:hover { background-color: #333333; border-color: #f08c28; }
-        QPushButton:pressed { background-color: #202020; border-color: #f08c28; }
-        QPushButton:disabled { color: #6f7378; border-color: #2c2c2c; }
-        QLineEdit, QComboBox, QTextEdit, QSpinBox, QDoubleSpinBox { background: #1a1a1a; border: 1px solid #2f2f2f; border-radius: 4px; padding: 4px; selection-background-color: #f08c28; selection-color: #0f0f0f; }
-        QComboBox::drop-down { border: 0; width: 18px; }
-        QSlider::groove:horizontal { height: 6px; background: #2c2c2c; border-radius: 3px; }
-        QSlider::handle:horizontal { width: 14px; background: #f08c28; border: 1px solid #b96a1f; margin: -5px 0; border-radius: 7px; }
-        QScrollBar { background: #1a1a1a; }
-        QScrollBar::handle { background: #3c3c3c; border-radius: 5px; }
-        QScrollBar::handle:hover { background: #505050; }
-        QLabel { color: #dfe3e8; }
-        QCheckBox { spacing: 6px; }
-    """)
+    app.setStyleSheet(GLOBAL_QSS)
+
+_HEX_RE = re.compile(r"#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+
+@lru_cache(maxsize=256)
+def _canonical_color(s):
+    """Return the '#rrggbb' form Qt resolves for a color string, or None if invalid."""
+    color = QtGui.QColor(s)
+    if not color.isValid():
+        return None
+    return color.name()
 
 def show_splash(app: QtWidgets.QApplication):
     """Display a lightweight splash while heavy Qt/PyVista bits initialize."""
@@ -75,15 +118,226 @@ def show_splash(app: QtWidgets.QApplication):
     app.processEvents()
     return splash
 
+def _read_path_history(history_file):
+    """Return the unique, still-existing paths listed one per line in a history file."""
+    paths = []
+    seen = set()
+    if os.path.exists(history_file):
+        try:
+            with open(history_file, "r") as f:
+                for line in f:
+                    path = line.strip()
+                    if path and path not in seen and os.path.exists(path):
+                        seen.add(path)
+                        paths.append(path)
+        except Exception:
+            pass
+    return paths
+
+_history_write_lock = threading.Lock()
+
+def _write_path_history(history_file, paths):
+    """Write paths one per line via a temp file + os.replace so readers never see a partial list."""
+    text = "".join(p + "\n" for p in paths)
+    tmp = history_file + ".tmp"
+    with _history_write_lock:
+        with open(tmp, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, history_file)
+    return True
+
+def _scan_script_history(examples_cache):
+    """Recent scripts followed by the bundled examples.
+
+    ``examples_cache`` is ``(mtime_ns, paths)`` from a previous scan; the examples
+    directory is only listed again when its mtime changed. Returns ``(paths, cache)``.
+    """
+    history = _read_path_history(config.HISTORY_FILE)
+    try:
+        mtime = os.stat(config.EXAMPLES_DIR).st_mtime_ns
+    except OSError:
+        return history, None
+    if examples_cache and examples_cache[0] == mtime:
+        examples = examples_cache[1]
+    else:
+        examples = []
+        try:
+            for filename in os.listdir(config.EXAMPLES_DIR):
+                if filename.endswith(".py"):
+                    examples.append(os.path.join(config.EXAMPLES_DIR, filename))
+        except Exception:
+            pass
+        examples_cache = (mtime, examples)
+    seen = set(history)
+    for full_path in examples:
+        if full_path not in seen:
+            seen.add(full_path)
+            history.append(full_path)
+    return history, examples_cache
+
+def _preload_meshes(paths):
+    """Parse STLs into visualizer.load_mesh's cache so later swaps are a cache hit."""
+    for path in paths:
+        if path and os.path.exists(path):
+            load_mesh(path)
+
+# Preflight limits are read from config once at import
+_PREFLIGHT_TARGETS = frozenset(("set_servo_angle", "set_position"))
+_JOINT_LIMITS = tuple(tuple(lim) for lim in getattr(config, "JOINT_LIMITS", []))
+_MAX_JOINT_SPEED = getattr(config, "JOINT_SPEED_LIMIT_DEG_S", None)
+_MAX_JOINT_ACC = getattr(config, "JOINT_ACC_LIMIT_DEG_S2", None)
+_MAX_TCP_SPEED = getattr(config, "TCP_SPEED_LIMIT_MM_S", None)
+_MAX_TCP_ACC = getattr(config, "TCP_ACC_LIMIT_MM_S2", None)
+
+# Literal evaluation dispatches on the node type; anything unregistered is "not a literal".
+# ast.Num (py<3.12 alias) subclasses ast.Constant, so registering Constant covers both.
+@singledispatch
+def _eval_num(node):
+    return None
+
+@_eval_num.register(ast.Constant)
+def _(node):
+    v = node.value
+    return float(v) if isinstance(v, (int, float)) else None
+
+@singledispatch
+def _eval_list(node):
+    return None
+
+@_eval_list.register(ast.List)
+@_eval_list.register(ast.Tuple)
+def _(node):
+    vals = []
+    for el in node.elts:
+        v = _eval_num(el)
+        if v is None:
+            return None
+        vals.append(v)
+    return vals
+
+def _check_call(name, node, warnings):
+    # positional args
+    args = node.args
+    kwargs = {kw.arg: kw.value for kw in node.keywords if kw.arg}
+    if name == "set_servo_angle":
+        angles_node = kwargs.get("angle") or (args[0] if args else None)
+        angles = _eval_list(angles_node) if angles_node is not None else None
+        speed = _eval_num(kwargs.get("speed") or (args[1] if len(args) > 1 else None))
+        acc = _eval_num(kwargs.get("mvacc") or (args[2] if len(args) > 2 else None))
+
+        if angles:
+            for idx, val in enumerate(angles):
+                if idx < len(_JOINT_LIMITS):
+                    lo, hi = _JOINT_LIMITS[idx]
+                    if val < lo or val > hi:
+                        warnings.append(f"Joint {idx+1} target {val} deg outside limits [{lo}, {hi}]")
+        if speed and _MAX_JOINT_SPEED and speed > _MAX_JOINT_SPEED:
+            warnings.append(f"Joint speed {speed} deg/s exceeds limit {_MAX_JOINT_SPEED}")
+        if acc and _MAX_JOINT_ACC and acc > _MAX_JOINT_ACC:
+            warnings.append(f"Joint acc {acc} deg/s^2 exceeds limit {_MAX_JOINT_ACC}")
+
+    if name == "set_position":
+        speed = _eval_num(kwargs.get("speed") or (args[6] if len(args) > 6 else None))
+        acc = _eval_num(kwargs.get("acc"))
+        if speed and _MAX_TCP_SPEED and speed > _MAX_TCP_SPEED:
+            warnings.append(f"TCP speed {speed} mm/s exceeds limit {_MAX_TCP_SPEED}")
+        if acc and _MAX_TCP_ACC and acc > _MAX_TCP_ACC:
+            warnings.append(f"TCP acc {acc} mm/s^2 exceeds limit {_MAX_TCP_ACC}")
+
+def _preflight_warnings(tree):
+    """Collect limit warnings for every set_servo_angle/set_position call in a parsed script."""
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        func_name = getattr(func, "attr", None) or getattr(func, "id", "")
+        if func_name in _PREFLIGHT_TARGETS:
+            calls.append((node.lineno, node.col_offset, func_name, node))
+    # ast.walk is breadth-first; report in source order like a depth-first visitor would
+    calls.sort(key=lambda c: (c[0], c[1]))
+    warnings = []
+    for _, _, func_name, node in calls:
+        _check_call(func_name, node, warnings)
+    return warnings
+
+def _drain(q):
+    """Take everything currently in a queue.Queue under a single lock acquisition."""
+    with q.mutex:
+        items = list(q.queue)
+        q.queue.clear()
+        if items:
+            q.not_full.notify_all()
+    return items
+
+class _TaskSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+
+class _IoTask(QtCore.QRunnable):
+    """Run a blocking file-system call on the global thread pool and emit its result."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception:
+            result = None
+        self.signals.finished.emit(result)
+
+class _DeferredResizeInteractor(QtInteractor):
+    """QtInteractor that coalesces a burst of resize events into one framebuffer resize."""
+
+    RESIZE_DELAY_MS = 30
+
+    def __init__(self, parent=None, on_resized=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._on_resized = on_resized
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DELAY_MS)
+        self._resize_timer.timeout.connect(self._apply_resize)
+
+    def resizeEvent(self, event):
+        event.accept()
+        self._resize_timer.start()
+
+    def _apply_resize(self):
+        size = self.size()
+        QtInteractor.resizeEvent(self, QtGui.QResizeEvent(size, size))
+        if self._on_resized:
+            self._on_resized()
+
 class AppContext:
     def __init__(self):
         self.log_queue = queue.Queue()
-        self.joint_queue = queue.Queue(maxsize=2)
+        # Latest joint sample only; deque append/pop are atomic, so no lock is needed
+        self.joint_queue = collections.deque(maxlen=1)
         self.stop_flag = False
         self.paused = False
 
 
 class QtControlPanel(QtWidgets.QMainWindow):
+    # (flag name, value) from SimXArmAPI.on_state_change; emitted on worker threads, delivered queued
+    api_state_changed = QtCore.pyqtSignal(str, object)
+    # Saved IP did not answer the startup probe (emitted from the probe thread)
+    auto_connect_skipped = QtCore.pyqtSignal(str)
+
+    # Factory colors per target; also the built-in "Default" preset
+    _COLOR_DEFAULTS = {
+        "bg": config.COLOR_BG,
+        "arm": config.COLOR_BASE,
+        "wrist": config.COLOR_WRIST,
+        "eef": config.COLOR_EEF,
+        "trace": config.COLOR_PATH,
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{config.APP_NAME} {config.APP_VERSION} | UFACTORY Lite 6 Simulator | Qt Controls")
@@ -96,16 +350,14 @@ class QtControlPanel(QtWidgets.QMainWindow):
         self.api = None
         self.ik_chain = None
         self.current_script_path = None
+        self.current_script_basename = ""  # cached for log banners; set with the path
         self.running_script = False
         self.was_colliding = False
+        # Widget-side repaint request (show/resize/resume); scene changes set viz.scene_dirty
+        self._dirty = True
+        self._last_pushed_joints = None  # last streamed sample written to the joint widgets
 
-        self.color_vars = {
-            "bg": config.COLOR_BG,
-            "arm": config.COLOR_BASE,
-            "wrist": config.COLOR_WRIST,
-            "eef": config.COLOR_EEF,
-            "trace": config.COLOR_PATH,
-        }
+        self.color_vars = dict(self._COLOR_DEFAULTS)
         self.color_presets = {"Default": dict(self.color_vars)}
 
         self.loop_enabled = False
@@ -113,10 +365,47 @@ class QtControlPanel(QtWidgets.QMainWindow):
         self.scale_mm = True
         self.collision_popup_shown = False
         self.script_history = []
+        self._history_set = set()  # mirrors script_history for O(1) membership tests
+        self._history_scans = 0  # history scans in flight
+        self._history_pending = []  # paths added while a scan is in flight, newest first
         self.stl_history = []
+        self._examples_cache = None
+        self._preflight_cache = {}  # path -> ((mtime_ns, size), warnings)
+        self._xarm_stub = None  # (xarm, xarm.wrapper) stand-in modules, see _install_xarm_stub
+        self._io_tasks = set()
         self._ip_store_path = os.path.join(config.USER_DATA_DIR, "robot_ip.txt")
-
-        self._build_ui()
+        self._last_saved_ip = None  # file contents as last read/written; None = unknown
+        self._settings = QtCore.QSettings(os.path.join(config.USER_DATA_DIR, "settings.ini"), QtCore.QSettings.IniFormat)
+
+        # Debounced persistence: bursts of preset/STL edits collapse into one disk write
+        self._persist_timer = QtCore.QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(500)
+        self._persist_timer.timeout.connect(self._persist_settings)
+
+        # Coalesce slider/spin drags: only the last value in a burst reaches the API/viz
+        self._joint_apply_timer = QtCore.QTimer(self)
+        self._joint_apply_timer.setSingleShot(True)
+        self._joint_apply_timer.setInterval(16)
+        self._joint_apply_timer.timeout.connect(self._apply_joint_changes)
+
+        # Color previews: typing only queues the value, the timer repaints once per burst
+        self._pending_colors = {}
+        self._color_pixmap_cache = {}
+        self._color_preview_timer = QtCore.QTimer(self)
+        self._color_preview_timer.setSingleShot(True)
+        self._color_preview_timer.setInterval(100)
+        self._color_preview_timer.timeout.connect(self._flush_color_previews)
+
+        # Log lines are buffered and written to the widget once per frame tick
+        self._log_buf = collections.deque(maxlen=5000)
+
+        # One layout/style pass for the whole panel instead of one per collapsible
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
         self._load_saved_ip()
 
         # Create the scene using the Qt interactor as the plotter backend
@@ -129,75 +418,31 @@ class QtControlPanel(QtWidgets.QMainWindow):
         self.api = SimXArmAPI(self.ctx, self.ik_chain)
         self.api.speed_multiplier = self.speed_value
         self.api.set_sim_only(True)
+        self.api_state_changed.connect(self._on_api_state_change)
+        self.api.on_state_change = self.api_state_changed.emit
+        self.auto_connect_skipped.connect(self._on_auto_connect_skipped)
+
+        # Preset grippers load in the background; the first Default/Vacuum click is then instant
+        self._run_io(_preload_meshes, [self.viz.get_mesh_path(f) for f in ("gripper_lite.stl", "vacuum_gripper_lite.stl")])
         # Stream listener state
         self.stream_host = "127.0.0.1"
         self.stream_port = 7777
         self.stream_status_state = "off"
 
+        self._sync_api_state()
+
         # Try to auto-connect to real robot if IP was saved and SDK available
         self._auto_connect_saved_ip()
 
         self._load_history()
         self._load_stl_history()
+        self._load_color_presets()
         self._refresh_color_presets()
 
-        # Timers
+        # Single ~30 Hz frame loop: pump queues, then render if anything changed
         self.render_timer = QtCore.QTimer(self)
         self.render_timer.timeout.connect(self._update_3d_loop)
-        self.render_timer.start(40)
-
-        self.queue_timer = QtCore.QTimer(self)
-        self.queue_timer.timeout.connect(self._process_queues)
-        self.queue_timer.start(30)
-
-    def _make_collapsible_old(self, title, content_widget, expanded=True):
-        """Return a small collapsible container with a toggle header and the given content."""
-        container = QtWidgets.QWidget()
-        vbox = QtWidgets.QVBoxLayout(container)
-        vbox.setContentsMargins(0, 0, 0, 0)
-        vbox.setSpacing(2)
-
-        toggle = QtWidgets.QPushButton(("▼ " if expanded else "► ") + title)
-        toggle.setCheckable(True)
-        toggle.setChecked(expanded)
-        toggle.setFlat(True)
-        toggle.setFocusPolicy(QtCore.Qt.NoFocus)
-        toggle.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background: transparent;
-                color: #dfe3e8;
-                padding: 2px 0;
-                font-weight: 600;
-                text-align: left;
-            }
-            QPushButton:hover,
-            QPushButton:pressed,
-            QPushButton:checked,
-            QPushButton:checked:hover,
-            QPushButton:checked:pressed,
-            QPushButton:focus {
-                border: none;
-                background: transparent;
-                color: #dfe3e8;
-            }
-        """)
-        vbox.addWidget(toggle)
-
-        frame = QtWidgets.QFrame()
-        frame_layout = QtWidgets.QVBoxLayout(frame)
-        frame_layout.setContentsMargins(8, 4, 8, 8)
-        frame_layout.addWidget(content_widget)
-        vbox.addWidget(frame)
-
-        def on_toggle(checked):
-            frame.setVisible(checked)
-            toggle.setText(("▼ " if checked else "► ") + title)
-
-        toggle.toggled.connect(on_toggle)
-        on_toggle(expanded)
-        return container
-
+        self.render_timer.start(33)
 
     def _build_ui(self):
         central = QtWidgets.QWidget()
@@ -211,7 +456,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
         header.setSpacing(8)
         # Restart GUI (left-aligned)
         btn_refresh_header = QtWidgets.QPushButton("Restart GUI")
-        btn_refresh_header.setToolTip("Restart the GUI (auto relaunches)")
+        btn_refresh_header.setToolTip("Rebuild the control panel (3D view, scene and log are kept)")
         btn_refresh_header.setFixedHeight(26)
         btn_refresh_header.clicked.connect(self._refresh_gui)
         header.addWidget(btn_refresh_header)
@@ -247,6 +492,39 @@ class QtControlPanel(QtWidgets.QMainWindow):
         splitter.setHandleWidth(8)
         main_layout.addWidget(splitter)
 
+        self._splitter = splitter
+        splitter.addWidget(self._build_controls())
+
+        # Right side: viewer and log
+        right_split = QtWidgets.QSplitter()
+        right_split.setOrientation(QtCore.Qt.Vertical)
+
+        # Viewer
+        self.viz_widget = _DeferredResizeInteractor(None, on_resized=self._mark_dirty)
+        viewer_container = QtWidgets.QWidget()
+        v_layout = QtWidgets.QVBoxLayout(viewer_container)
+        v_layout.setContentsMargins(0, 0, 0, 0)
+        v_layout.addWidget(self.viz_widget)
+        right_split.addWidget(viewer_container)
+
+        # Log
+        log_container = QtWidgets.QWidget()
+        log_layout = QtWidgets.QVBoxLayout(log_container)
+        self.log_text = QtWidgets.QPlainTextEdit()
+        self.log_text.setReadOnly(True)
+        # Qt drops the oldest lines itself once the cap is reached
+        self.log_text.setMaximumBlockCount(5000)
+        log_layout.addWidget(self.log_text)
+        right_split.addWidget(log_container)
+
+        splitter.addWidget(right_split)
+        splitter.setStretchFactor(0, 0)
+        splitter.setStretchFactor(1, 1)
+        splitter.setSizes([400, 1000])
+        right_split.setSizes([750, 200])
+
+    def _build_controls(self):
+        """Left-hand control column (everything except the header, viewer and log)."""
         # Left controls
         left = QtWidgets.QWidget()
         left_layout = QtWidgets.QVBoxLayout(left)
@@ -362,6 +640,8 @@ class QtControlPanel(QtWidgets.QMainWindow):
         j_layout = QtWidgets.QVBoxLayout(joints_group)
         self.joint_sliders = []
         self.joint_spin = []
+        # Slider positions are tenths of a degree; convert all limits in one pass
+        self._limits_i = np.rint(np.asarray(config.JOINT_LIMITS, dtype=float) * 10).astype(np.int32)
         for i in range(config.JOINT_COUNT):
             row = QtWidgets.QHBoxLayout()
             label = QtWidgets.QLabel(f"Joint {i+1}")
@@ -377,10 +657,9 @@ class QtControlPanel(QtWidgets.QMainWindow):
             row.addWidget(spin)
 
             slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
-            min_lim = int(config.JOINT_LIMITS[i][0] * 10)
-            max_lim = int(config.JOINT_LIMITS[i][1] * 10)
-            slider.setMinimum(min_lim)
-            slider.setMaximum(max_lim)
+            min_lim, max_lim = self._limits_i[i]
+            slider.setMinimum(int(min_lim))
+            slider.setMaximum(int(max_lim))
             slider.setValue(0)
             self.joint_sliders.append(slider)
             row.addWidget(slider, 1)
@@ -397,6 +676,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
         self.btn_reset_view.clicked.connect(self._reset_view)
         btn_row.addWidget(self.btn_reset_view)
         left_layout.addWidget(joints_group)
+        self.joints_group = joints_group
         left_layout.addLayout(btn_row)
 
         # Trace / visibility
@@ -429,15 +709,71 @@ class QtControlPanel(QtWidgets.QMainWindow):
         tr_layout.setColumnStretch(3, 1)
         left_layout.addWidget(self._make_collapsible("Trace & Visibility", trace_group, expanded=False))
 
-        # Color settings (single column, scroll-friendly)
+        # Color settings (single column, scroll-friendly); built lazily on first expand
+        self.color_inputs = {}
+        self.color_previews = {}
+        self.combo_color_presets = None
+        left_layout.addWidget(self._make_collapsible("Color Settings", self._build_color_group, expanded=False))
+
+        # End effector config
+        ef_group = QtWidgets.QGroupBox("End-Effector Configuration")
+        ef_group.setTitle("")
+        ef_layout = QtWidgets.QVBoxLayout(ef_group)
+        self.scale_mm_chk = QtWidgets.QCheckBox("Custom end-effector is in millimeters?")
+        self.scale_mm_chk.setChecked(True)
+        self.scale_mm_chk.stateChanged.connect(lambda _: self._set_scale_mm(self.scale_mm_chk.isChecked()))
+        ef_layout.addWidget(self.scale_mm_chk)
+        stl_row = QtWidgets.QHBoxLayout()
+        self.combo_stls = QtWidgets.QComboBox()
+        self.combo_stls.currentIndexChanged.connect(self._on_stl_history_select)
+        stl_row.addWidget(self.combo_stls, 1)
+        self.btn_load_stl = QtWidgets.QPushButton("Load Custom STL...")
+        self.btn_load_stl.clicked.connect(self._load_custom_gripper)
+        stl_row.addWidget(self.btn_load_stl)
+        ef_layout.addLayout(stl_row)
+        preset_row = QtWidgets.QHBoxLayout()
+        self.btn_preset_std = QtWidgets.QPushButton("Default Gripper")
+        self.btn_preset_std.clicked.connect(lambda: self._load_specific_gripper("gripper_lite.stl"))
+        preset_row.addWidget(self.btn_preset_std)
+        self.btn_preset_vac = QtWidgets.QPushButton("Vacuum Gripper")
+        self.btn_preset_vac.clicked.connect(lambda: self._load_specific_gripper("vacuum_gripper_lite.stl"))
+        preset_row.addWidget(self.btn_preset_vac)
+        self.btn_preset_remove = QtWidgets.QPushButton("Remove")
+        self.btn_preset_remove.clicked.connect(self._remove_gripper)
+        preset_row.addWidget(self.btn_preset_remove)
+        ef_layout.addLayout(preset_row)
+        left_layout.addWidget(self._make_collapsible("End-Effector Configuration", ef_group, expanded=False))
+
+        left_layout.addStretch(1)
+        left_container = QtWidgets.QWidget()
+        left_container.setLayout(left_layout)
+        left_container.setMinimumWidth(480)
+        left_scroll = QtWidgets.QScrollArea()
+        left_scroll.setWidgetResizable(True)
+        left_scroll.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        left_scroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        left_scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
+        left_scroll.setStyleSheet(_LEFT_SCROLL_QSS)
+        left_scroll.setWidget(left_container)
+        left_scroll.setMinimumWidth(480)
+        left_scroll.setMaximumWidth(650)
+
+        # Widgets enabled only while idle / only while a script runs (see _toggle_controls)
+        self._widgets_when_idle = [
+            self.btn_browse, self.combo_history, self.speed_slider, self.loop_chk,
+            self.btn_load_stl, self.btn_preset_std, self.btn_preset_vac, self.btn_preset_remove,
+        ]
+        self._widgets_when_running = [self.btn_stop, self.btn_restart, self.btn_pause]
+        return left_scroll
+
+    def _build_color_group(self):
+        """Color Settings content; built on first expand of its collapsible."""
         color_group = QtWidgets.QGroupBox("Color Settings")
         color_group.setTitle("")
         cg_layout = QtWidgets.QGridLayout(color_group)
         cg_layout.setContentsMargins(10, 8, 10, 8)
         cg_layout.setHorizontalSpacing(8)
         cg_layout.setVerticalSpacing(6)
-        self.color_inputs = {}
-        self.color_previews = {}
         labels = [("Background", "bg"), ("Robot Arm", "arm"), ("Wrist", "wrist"), ("End-Effector", "eef"), ("Trace", "trace")]
 
         for idx, (lbl, key) in enumerate(labels):
@@ -451,6 +787,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
             preview.setFixedSize(22, 22)
             preview.setFrameShape(QtWidgets.QFrame.Box)
             preview.setLineWidth(1)
+            preview.setScaledContents(True)
             self.color_previews[key] = preview
             cg_layout.addWidget(preview, idx, 2)
 
@@ -468,7 +805,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
             btn_reset.clicked.connect(lambda _, k=key: self._reset_color(k))
             cg_layout.addWidget(btn_reset, idx, 4)
 
-            edit.textChanged.connect(lambda val, k=key: self._update_color_preview(k, val))
+            edit.textChanged.connect(lambda val, k=key: self._queue_color_preview(k, val))
             self._update_color_preview(key, self.color_vars[key])
 
         preset_row = QtWidgets.QHBoxLayout()
@@ -484,182 +821,114 @@ class QtControlPanel(QtWidgets.QMainWindow):
         self.btn_save_preset.setMinimumWidth(110)
         self.btn_save_preset.setMinimumHeight(26)
         self.btn_save_preset.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        self.btn_save_preset.clicked.connect(self._save_color_preset)
         preset_row.addWidget(self.btn_save_preset)
         self.btn_load_preset = QtWidgets.QPushButton("Load")
         self.btn_load_preset.setMinimumWidth(80)
         self.btn_load_preset.setMinimumHeight(26)
         self.btn_load_preset.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        self.btn_load_preset.clicked.connect(self._load_color_preset)
         preset_row.addWidget(self.btn_load_preset)
         preset_row.addStretch(1)
         cg_layout.addLayout(preset_row, len(labels), 0, 1, 5)
 
         cg_layout.setColumnStretch(1, 1)
         color_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-        left_layout.addWidget(self._make_collapsible("Color Settings", color_group, expanded=False))
-
-        # End effector config
-        ef_group = QtWidgets.QGroupBox("End-Effector Configuration")
-        ef_group.setTitle("")
-        ef_layout = QtWidgets.QVBoxLayout(ef_group)
-        self.scale_mm_chk = QtWidgets.QCheckBox("Custom end-effector is in millimeters?")
-        self.scale_mm_chk.setChecked(True)
-        self.scale_mm_chk.stateChanged.connect(lambda _: self._set_scale_mm(self.scale_mm_chk.isChecked()))
-        ef_layout.addWidget(self.scale_mm_chk)
-        stl_row = QtWidgets.QHBoxLayout()
-        self.combo_stls = QtWidgets.QComboBox()
-        self.combo_stls.currentIndexChanged.connect(self._on_stl_history_select)
-        stl_row.addWidget(self.combo_stls, 1)
-        self.btn_load_stl = QtWidgets.QPushButton("Load Custom STL...")
-        self.btn_load_stl.clicked.connect(self._load_custom_gripper)
-        stl_row.addWidget(self.btn_load_stl)
-        ef_layout.addLayout(stl_row)
-        preset_row = QtWidgets.QHBoxLayout()
-        self.btn_preset_std = QtWidgets.QPushButton("Default Gripper")
-        self.btn_preset_std.clicked.connect(lambda: self._load_specific_gripper("gripper_lite.stl"))
-        preset_row.addWidget(self.btn_preset_std)
-        self.btn_preset_vac = QtWidgets.QPushButton("Vacuum Gripper")
-        self.btn_preset_vac.clicked.connect(lambda: self._load_specific_gripper("vacuum_gripper_lite.stl"))
-        preset_row.addWidget(self.btn_preset_vac)
-        self.btn_preset_remove = QtWidgets.QPushButton("Remove")
-        self.btn_preset_remove.clicked.connect(self._remove_gripper)
-        preset_row.addWidget(self.btn_preset_remove)
-        ef_layout.addLayout(preset_row)
-        left_layout.addWidget(self._make_collapsible("End-Effector Configuration", ef_group, expanded=False))
-
-        left_layout.addStretch(1)
-        left_container = QtWidgets.QWidget()
-        left_container.setLayout(left_layout)
-        left_container.setMinimumWidth(480)
-        left_scroll = QtWidgets.QScrollArea()
-        left_scroll.setWidgetResizable(True)
-        left_scroll.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
-        left_scroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        left_scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
-        left_scroll.setStyleSheet("""
-            QScrollArea { background: transparent; border: none; }
-            QScrollArea > QWidget > QWidget { background: #242424; }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 9px;
-                margin: 4px 0 4px 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #454545;
-                min-height: 24px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
-        left_scroll.setWidget(left_container)
-        left_scroll.setMinimumWidth(480)
-        left_scroll.setMaximumWidth(650)
-        splitter.addWidget(left_scroll)
-
-        # Right side: viewer and log
-        right_split = QtWidgets.QSplitter()
-        right_split.setOrientation(QtCore.Qt.Vertical)
+        self._refresh_color_presets()
+        return color_group
 
-        # Viewer
-        self.viz_widget = QtInteractor(None)
-        viewer_container = QtWidgets.QWidget()
-        v_layout = QtWidgets.QVBoxLayout(viewer_container)
-        v_layout.setContentsMargins(0, 0, 0, 0)
-        v_layout.addWidget(self.viz_widget)
-        right_split.addWidget(viewer_container)
+    # ---------- History helpers ----------
+    def _run_io(self, fn, *args, on_done=None):
+        """Run fn(*args) on the thread pool; on_done(result) is delivered on the GUI thread."""
+        task = _IoTask(fn, *args)
+        self._io_tasks.add(task)  # keep the runnable (and its signals) alive until delivery
 
-        # Log
-        log_container = QtWidgets.QWidget()
-        log_layout = QtWidgets.QVBoxLayout(log_container)
-        self.log_text = QtWidgets.QTextEdit()
-        self.log_text.setReadOnly(True)
-        log_layout.addWidget(self.log_text)
-        right_split.addWidget(log_container)
+        def finish(result, task=task):
+            self._io_tasks.discard(task)
+            if on_done:
+                on_done(result)
 
-        splitter.addWidget(right_split)
-        splitter.setStretchFactor(0, 0)
-        splitter.setStretchFactor(1, 1)
-        splitter.setSizes([400, 1000])
-        right_split.setSizes([750, 200])
+        task.signals.finished.connect(finish)
+        QtCore.QThreadPool.globalInstance().start(task)
 
-    # ---------- History helpers ----------
     def _load_history(self):
-        self.script_history = []
-        if os.path.exists(config.HISTORY_FILE):
-            try:
-                with open(config.HISTORY_FILE, "r") as f:
-                    for line in f:
-                        path = line.strip()
-                        if path and os.path.exists(path) and path not in self.script_history:
-                            self.script_history.append(path)
-            except Exception:
-                pass
-        if os.path.exists(config.EXAMPLES_DIR):
-            try:
-                for filename in os.listdir(config.EXAMPLES_DIR):
-                    if filename.endswith(".py"):
-                        full_path = os.path.join(config.EXAMPLES_DIR, filename)
-                        if full_path not in self.script_history:
-                            self.script_history.append(full_path)
-            except Exception:
-                pass
-        display = []
+        self._history_scans += 1
+        self._run_io(_scan_script_history, self._examples_cache, on_done=self._on_history_loaded)
+
+    def _history_labels(self):
+        labels = []
         for p in self.script_history:
             name = os.path.basename(p)
             if config.EXAMPLES_DIR in p:
                 name = f"[Example] {name}"
-            display.append(name)
-        self.combo_history.clear()
-        self.combo_history.addItems(display)
-        if display:
-            self.combo_history.setCurrentIndex(0)
-            self.current_script_path = self.script_history[0]
-            self.btn_run.setEnabled(True)
-        else:
-            self.btn_run.setEnabled(False)
+            labels.append(name)
+        return labels
+
+    def _on_history_loaded(self, result):
+        self._history_scans -= 1
+        pending = self._history_pending
+        if not self._history_scans:
+            self._history_pending = []
+        if result is None:
+            return
+        loaded, self._examples_cache = result
+        # The scan is authoritative (deleted files drop out); only paths added
+        # (Browse / run) while it was in flight are kept on top of it
+        pending_set = set(pending)
+        merged = pending + [p for p in loaded if p not in pending_set]
+        self.script_history = merged
+        self._history_set = set(merged)
+        with QtCore.QSignalBlocker(self.combo_history):
+            self.combo_history.clear()
+            self.combo_history.addItems(self._history_labels())
+            if self.current_script_path in self._history_set:
+                self.combo_history.setCurrentIndex(merged.index(self.current_script_path))
+            elif merged:
+                self.combo_history.setCurrentIndex(0)
+                self._set_current_script(merged[0])
+        self.btn_run.setEnabled(self.current_script_path is not None and not self.running_script)
+        if pending:
+            # The writes made during the scan only saw the old list; store the merged one
+            self._persist_script_history()
 
     def _add_to_history(self, path):
-        if path in self.script_history:
+        if self._history_scans:
+            if path in self._history_pending:
+                self._history_pending.remove(path)
+            self._history_pending.insert(0, path)
+        if path in self._history_set:
             self.script_history.remove(path)
+        else:
+            self._history_set.add(path)
         self.script_history.insert(0, path)
-        display = []
-        for p in self.script_history:
-            name = os.path.basename(p)
-            if config.EXAMPLES_DIR in p:
-                name = f"[Example] {name}"
-            display.append(name)
+        display = self._history_labels()
         self.combo_history.clear()
         self.combo_history.addItems(display)
         if display:
             self.combo_history.setCurrentIndex(0)
-        try:
-            user_scripts = [p for p in self.script_history if config.EXAMPLES_DIR not in p]
-            with open(config.HISTORY_FILE, "w") as f:
-                for p in user_scripts[:10]:
-                    f.write(p + "\n")
-        except Exception:
-            pass
+        self._persist_script_history()
+
+    def _persist_script_history(self):
+        user_scripts = [p for p in self.script_history if config.EXAMPLES_DIR not in p]
+        self._run_io(_write_path_history, config.HISTORY_FILE, user_scripts[:10])
+
+    def _set_current_script(self, path):
+        self.current_script_path = path
+        self.current_script_basename = os.path.basename(path)
 
     def _on_history_select(self, idx):
         if idx >= 0 and idx < len(self.script_history):
-            self.current_script_path = self.script_history[idx]
+            self._set_current_script(self.script_history[idx])
             self.btn_run.setEnabled(True)
 
     def _load_stl_history(self):
-        self.stl_history = []
-        if os.path.exists(config.STL_HISTORY_FILE):
-            try:
-                with open(config.STL_HISTORY_FILE, "r") as f:
-                    for line in f:
-                        path = line.strip()
-                        if path and os.path.exists(path) and path not in self.stl_history:
-                            self.stl_history.append(path)
-            except Exception:
-                pass
+        self._run_io(_read_path_history, config.STL_HISTORY_FILE, on_done=self._on_stl_history_loaded)
+
+    def _on_stl_history_loaded(self, paths):
+        self.stl_history = paths or []
+        self._populate_stl_combo()
+
+    def _populate_stl_combo(self):
         self.combo_stls.clear()
         display = [os.path.basename(p) for p in self.stl_history]
         if display:
@@ -674,56 +943,103 @@ class QtControlPanel(QtWidgets.QMainWindow):
             self.stl_history.remove(path)
         self.stl_history.insert(0, path)
         self.stl_history = self.stl_history[:10]
+        self._persist_timer.start()
+        self.combo_stls.setEnabled(True)
+        self._populate_stl_combo()
+
+    def _load_color_presets(self):
+        """Restore saved color presets; the built-in Default always wins."""
+        self._settings.beginGroup("colors")
+        raw = self._settings.value("presets", "")
+        self._settings.endGroup()
+        if not raw:
+            return
         try:
-            with open(config.STL_HISTORY_FILE, "w") as f:
-                for p in self.stl_history:
-                    f.write(p + "\n")
+            saved = json_loads(raw)
         except Exception:
-            pass
-        self.combo_stls.setEnabled(True)
-        self._load_stl_history()
+            return
+        if isinstance(saved, dict):
+            for name, vals in saved.items():
+                if name != "Default" and isinstance(vals, dict):
+                    self.color_presets[name] = {k: str(v) for k, v in vals.items()}
+
+    def _persist_settings(self):
+        """Flush color presets and STL history to disk (runs on the debounce timer)."""
+        user_presets = {k: v for k, v in self.color_presets.items() if k != "Default"}
+        self._settings.beginGroup("colors")
+        self._settings.setValue("presets", json_dumps(user_presets))
+        self._settings.endGroup()
+        self._settings.sync()
+        self._run_io(_write_path_history, config.STL_HISTORY_FILE, list(self.stl_history))
+
+    def _mark_dirty(self):
+        self._dirty = True
+
+    def showEvent(self, event):
+        self._dirty = True
+        super().showEvent(event)
+
+    def closeEvent(self, event):
+        # Flush any pending debounced write before the window goes away
+        if self._persist_timer.isActive():
+            self._persist_timer.stop()
+            self._persist_settings()
+        # Let queued history writes land before the process exits
+        QtCore.QThreadPool.globalInstance().waitForDone(2000)
+        super().closeEvent(event)
 
     def _append_log(self, msg):
         # Ensure a consistent prefix for readability
         if msg and not str(msg).startswith("["):
             msg = "[INFO] " + str(msg)
-        self.log_text.append(msg)
+        self._log_buf.append(str(msg))
+
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        self.log_text.appendPlainText(text)
         self.log_text.moveCursor(QtGui.QTextCursor.End)
 
     def _on_slider_changed(self, idx, val):
         # slider value is *10
-        deg = val / 10.0
+        deg = val * 0.1
         self.joint_spin[idx].blockSignals(True)
         self.joint_spin[idx].setValue(deg)
         self.joint_spin[idx].blockSignals(False)
-        self._apply_joint_changes()
+        self._joint_apply_timer.start()
 
     def _on_spin_changed(self, idx, val):
         self.joint_sliders[idx].blockSignals(True)
         self.joint_sliders[idx].setValue(int(val * 10))
         self.joint_sliders[idx].blockSignals(False)
-        self._apply_joint_changes()
+        self._joint_apply_timer.start()
 
     def _apply_joint_changes(self):
+        # A fresh list per edit: the API keeps this object as joints_deg and script threads
+        # read it, so a reused buffer would change under them outside data_lock
+        joints = [spin.value() for spin in self.joint_spin]
+        # GUI thread owns the viz; the lock only guards the API state shared with script threads
         with self.data_lock:
-            current = [spin.value() for spin in self.joint_spin]
-            self.api.joints_deg = current
-            self.viz.update_joints(current)
+            self.api.joints_deg = joints
+        self.viz.update_joints(joints)
+        self._last_pushed_joints = None
 
     def _home(self):
         self.ctx.log_queue.put("[GUI] Going home...")
         self.collision_popup_shown = False
+        zeros = [0.0] * config.JOINT_COUNT
         with self.data_lock:
-            zeros = [0.0] * config.JOINT_COUNT
-            for spin, slider in zip(self.joint_spin, self.joint_sliders):
-                spin.blockSignals(True)
-                slider.blockSignals(True)
-                spin.setValue(0.0)
-                slider.setValue(0)
-                spin.blockSignals(False)
-                slider.blockSignals(False)
             self.api.joints_deg = zeros
-            self.viz.update_joints(zeros)
+        self.viz.update_joints(zeros)
+        blockers = [QtCore.QSignalBlocker(w) for w in (*self.joint_spin, *self.joint_sliders)]
+        for spin in self.joint_spin:
+            spin.setValue(0.0)
+        for slider in self.joint_sliders:
+            slider.setValue(0)
+        del blockers
+        self._last_pushed_joints = None
         if self.api.real_arm:
             self.api.set_servo_angle([0] * 6, speed=30, wait=False)
 
@@ -732,108 +1048,123 @@ class QtControlPanel(QtWidgets.QMainWindow):
             self.viz.reset_camera_view()
 
     def _reset_all_colors(self):
-        defaults = {
-            "bg": config.COLOR_BG,
-            "arm": config.COLOR_BASE,
-            "wrist": config.COLOR_WRIST,
-            "eef": config.COLOR_EEF,
-            "trace": config.COLOR_PATH,
-        }
-        for key, val in defaults.items():
-            if key in self.color_inputs:
-                self.color_inputs[key].setText(val)
-                self._apply_color(key)
+        for key, val in self._COLOR_DEFAULTS.items():
+            self._set_color_value(key, val)
+
+    def _set_color_value(self, key, val):
+        """Apply a color through its input row, or straight to the viz if the row isn't built yet."""
+        if key in self.color_inputs:
+            self.color_inputs[key].setText(val)
+            self._apply_color(key)
+        elif self.viz.set_color(key, val):
+            self.color_vars[key] = val
 
     def _refresh_gui(self):
-        script_path = os.path.abspath(sys.argv[0])
-        cmd = [sys.executable, script_path]
+        """Rebuild the left control column in place; viewer, scene, API and log stay alive."""
+        # Widget-only state that is not mirrored anywhere else
+        keep = {
+            "ip": self.edit_robot_ip.text(),
+            "trace_mode": self.trace_mode.currentText(),
+            "ghost": self.ghost_chk.isChecked(),
+            "ignore_eef": self.ignore_eef_chk.isChecked(),
+            "collision_alerts": self.collision_alert_chk.isChecked(),
+        }
+        self._color_preview_timer.stop()
+        self._pending_colors.clear()
+
+        splitter = self._splitter
+        sizes = splitter.sizes()
+        old = splitter.widget(0)
+        self.setUpdatesEnabled(False)
         try:
-            subprocess.Popen(cmd, cwd=os.path.dirname(script_path))
-        except Exception:
-            pass
-        QtWidgets.QApplication.quit()
+            new = self._build_controls()
+            old.hide()
+            old.setParent(None)
+            old.deleteLater()
+            splitter.insertWidget(0, new)
+            splitter.setSizes(sizes)
+            self._restore_controls(keep)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._append_log("[GUI] Controls rebuilt.")
+
+    def _restore_controls(self, keep):
+        """Push the current app state into freshly built control widgets without firing handlers."""
+        widgets = (
+            self.edit_robot_ip, self.loop_chk, self.speed_slider, self.trace_chk, self.trace_mode,
+            self.ghost_chk, self.ignore_eef_chk, self.collision_alert_chk, self.scale_mm_chk,
+            self.combo_history, self.combo_stls, *self.joint_spin, *self.joint_sliders,
+        )
+        blockers = [QtCore.QSignalBlocker(w) for w in widgets]
+        try:
+            self.edit_robot_ip.setText(keep["ip"])
+            self.loop_chk.setChecked(self.loop_enabled)
+            self.speed_slider.setValue(int(round(self.speed_value * 10)))
+            self.speed_lbl.setText(f"{self.speed_value:.1f}x")
+            self.trace_chk.setChecked(self.viz.trace_enabled)
+            self.trace_mode.setCurrentText(keep["trace_mode"])
+            self.ghost_chk.setChecked(keep["ghost"])
+            self.ignore_eef_chk.setChecked(keep["ignore_eef"])
+            self.ignore_eef_chk.setEnabled(keep["ghost"])
+            self.collision_alert_chk.setChecked(keep["collision_alerts"])
+            self.scale_mm_chk.setChecked(self.scale_mm)
+
+            self.combo_history.addItems(self._history_labels())
+            if self.current_script_path in self._history_set:
+                self.combo_history.setCurrentIndex(self.script_history.index(self.current_script_path))
+            self._populate_stl_combo()
+
+            for spin, slider, val in zip(self.joint_spin, self.joint_sliders, self.viz.current_joints):
+                spin.setValue(val)
+                slider.setValue(int(val * 10))
+        finally:
+            for b in blockers:
+                b.unblock()
+        self._last_pushed_joints = None
+
+        self.btn_stream_toggle.setChecked(self.api.stream_running)
+        self.btn_stream_toggle.setText("Stop Live Stream" if self.api.stream_running else "Start Live Stream")
+        self.btn_pause.setText("Resume" if self.ctx.paused else "Pause")
+        self.stream_status_state = None  # force the new label to be styled
+        self._sync_api_state()
+        self._refresh_color_presets()
+        self._toggle_controls(self.running_script)
 
     def _preflight_script(self, path):
         """Static check for obvious out-of-limit commands in a script."""
         warnings = []
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            self._append_log(f"[SAFEGUARD] Preflight skipped: {e}")
+            return warnings
+        # Unchanged file since the last check (loop/restart runs): reuse the result
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._preflight_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return list(cached[1])
         try:
             with open(path, "r", encoding="utf-8") as f:
                 src = f.read()
+            # No checked call anywhere in the text: nothing to parse
+            if not any(name in src for name in _PREFLIGHT_TARGETS):
+                self._preflight_cache[path] = (stamp, [])
+                return warnings
             tree = ast.parse(src, filename=path)
         except Exception as e:
             self._append_log(f"[SAFEGUARD] Preflight skipped: {e}")
             return warnings
 
-        joint_limits = getattr(config, "JOINT_LIMITS", [])
-        max_joint_speed = getattr(config, "JOINT_SPEED_LIMIT_DEG_S", None)
-        max_joint_acc = getattr(config, "JOINT_ACC_LIMIT_DEG_S2", None)
-        max_tcp_speed = getattr(config, "TCP_SPEED_LIMIT_MM_S", None)
-        max_tcp_acc = getattr(config, "TCP_ACC_LIMIT_MM_S2", None)
-
-        def eval_num(node):
-            if isinstance(node, (ast.Num, ast.Constant)) and isinstance(node.value, (int, float)):
-                return float(node.value)
-            return None
-
-        def eval_list(node):
-            if isinstance(node, (ast.List, ast.Tuple)):
-                vals = []
-                for el in node.elts:
-                    v = eval_num(el)
-                    if v is None:
-                        return None
-                    vals.append(v)
-                return vals
-            return None
-
-        class Checker(ast.NodeVisitor):
-            def visit_Call(self, node):
-                func_name = ""
-                if isinstance(node.func, ast.Attribute):
-                    func_name = node.func.attr
-                elif isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                if func_name in ("set_servo_angle", "set_position"):
-                    self.check_call(func_name, node)
-                self.generic_visit(node)
-
-            def check_call(self, name, node):
-                # positional args
-                args = list(node.args)
-                kwargs = {kw.arg: kw.value for kw in node.keywords if kw.arg}
-                if name == "set_servo_angle":
-                    angles_node = kwargs.get("angle") or (args[0] if args else None)
-                    angles = eval_list(angles_node) if angles_node is not None else None
-                    speed = eval_num(kwargs.get("speed") or (args[1] if len(args) > 1 else None))
-                    acc = eval_num(kwargs.get("mvacc") or (args[2] if len(args) > 2 else None))
-
-                    if angles:
-                        for idx, val in enumerate(angles):
-                            if idx < len(joint_limits):
-                                lo, hi = joint_limits[idx]
-                                if val < lo or val > hi:
-                                    warnings.append(f"Joint {idx+1} target {val} deg outside limits [{lo}, {hi}]")
-                    if speed and max_joint_speed and speed > max_joint_speed:
-                        warnings.append(f"Joint speed {speed} deg/s exceeds limit {max_joint_speed}")
-                    if acc and max_joint_acc and acc > max_joint_acc:
-                        warnings.append(f"Joint acc {acc} deg/s^2 exceeds limit {max_joint_acc}")
-
-                if name == "set_position":
-                    speed = eval_num(kwargs.get("speed") or (args[6] if len(args) > 6 else None))
-                    acc = eval_num(kwargs.get("acc"))
-                    if speed and max_tcp_speed and speed > max_tcp_speed:
-                        warnings.append(f"TCP speed {speed} mm/s exceeds limit {max_tcp_speed}")
-                    if acc and max_tcp_acc and acc > max_tcp_acc:
-                        warnings.append(f"TCP acc {acc} mm/s^2 exceeds limit {max_tcp_acc}")
-
-        Checker().visit(tree)
+        warnings = _preflight_warnings(tree)
+        self._preflight_cache[path] = (stamp, list(warnings))
         return warnings
+
     def _browse_script(self):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select script", os.getcwd(), "Python Files (*.py)")
         if path:
             self._add_to_history(path)
-            self.current_script_path = path
-            self._append_log(f"[GUI] Selected: {os.path.basename(path)}")
+            self._set_current_script(path)
+            self._append_log(f"[GUI] Selected: {self.current_script_basename}")
             self.btn_run.setEnabled(True)
 
     def _run_current_script(self):
@@ -861,7 +1192,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
         self._toggle_controls(running=True)
         self.ctx.stop_flag = False
         self.ctx.paused = False
-        threading.Thread(target=self._run_script_thread, args=(self.current_script_path,), daemon=True).start()
+        threading.Thread(target=self._run_script_thread, args=(self.current_script_path, self.current_script_basename), daemon=True).start()
 
     def _restart_script(self):
         self._stop_script()
@@ -921,6 +1252,32 @@ class QtControlPanel(QtWidgets.QMainWindow):
             self._set_stream_status("off")
             self._append_log(f"[STREAM] Failed to start: {e}")
 
+    def _on_api_state_change(self, name, value):
+        self._sync_api_state()
+
+    def _sync_api_state(self):
+        """Mirror the API's stream/connection/sim-only flags into the status widgets."""
+        new_state = "off"
+        if self.api.stream_running:
+            new_state = "connected" if self.api.stream_connected else "listening"
+        self._set_stream_status(new_state)
+
+        # Update real-robot connection indicator
+        if self.api.is_connected:
+            self._set_connection_status("connected")
+            self.btn_connect_real.setText("Disconnect")
+            self.btn_disconnect_real.setEnabled(True)
+            self.edit_robot_ip.setEnabled(False)
+        else:
+            if not self.btn_connect_real.text().startswith("Connecting"):
+                self._set_connection_status("disconnected")
+                self.btn_connect_real.setText("Connect to Robot")
+                self.btn_disconnect_real.setEnabled(False)
+                self.edit_robot_ip.setEnabled(True)
+        # keep sim-only checkbox reflecting API
+        with QtCore.QSignalBlocker(self.sim_only_chk):
+            self.sim_only_chk.setChecked(self.api.sim_only_mode)
+
     def _set_stream_status(self, state):
         if state == self.stream_status_state:
             return
@@ -1011,40 +1368,57 @@ class QtControlPanel(QtWidgets.QMainWindow):
             return
         if not ip:
             return
-        # Quick port probe to avoid hanging when nothing is reachable
-        try:
-            with socket.create_connection((ip, config.ROBOT_SCAN_PORT), timeout=1.0):
-                pass
-        except Exception:
-            self._append_log(f"[REAL] Auto-connect skipped (no robot at {ip})")
-            self._set_connection_status("disconnected")
-            self.btn_connect_real.setText("Connect to Robot")
-            self.btn_connect_real.setEnabled(True)
-            self.edit_robot_ip.setEnabled(True)
-            self.btn_disconnect_real.setEnabled(False)
-            return
         # mimic button state for connect
         self.btn_connect_real.setEnabled(False)
         self.btn_disconnect_real.setEnabled(False)
         self.edit_robot_ip.setEnabled(False)
         self.btn_connect_real.setText("Connecting...")
         self._set_connection_status("connecting")
-        threading.Thread(target=self._connect_real_thread, args=(ip, True), daemon=True).start()
+        # Probe + connect off the GUI thread so startup never waits on an unreachable IP
+        threading.Thread(target=self._auto_connect_thread, args=(ip,), daemon=True).start()
+
+    def _auto_connect_thread(self, ip):
+        # Quick port probe; the SDK connect re-probes anyway, so failing fast is safe
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(0.3)
+        try:
+            reachable = sock.connect_ex((ip, config.ROBOT_SCAN_PORT)) == 0
+        except OSError:
+            reachable = False
+        finally:
+            sock.close()
+        if not reachable:
+            self.auto_connect_skipped.emit(ip)
+            return
+        self._connect_real_thread(ip, True)
+
+    def _on_auto_connect_skipped(self, ip):
+        self._append_log(f"[REAL] Auto-connect skipped (no robot at {ip})")
+        self._set_connection_status("disconnected")
+        self.btn_connect_real.setText("Connect to Robot")
+        self.btn_connect_real.setEnabled(True)
+        self.edit_robot_ip.setEnabled(True)
+        self.btn_disconnect_real.setEnabled(False)
 
     def _load_saved_ip(self):
         try:
-            if os.path.exists(self._ip_store_path):
-                with open(self._ip_store_path, "r", encoding="utf-8") as f:
-                    saved_ip = f.read().strip()
-                    if saved_ip:
-                        self.edit_robot_ip.setText(saved_ip)
+            with open(self._ip_store_path, "r", encoding="utf-8") as f:
+                saved_ip = f.read().strip()
         except Exception:
-            pass
+            return
+        self._last_saved_ip = saved_ip
+        if saved_ip:
+            self.edit_robot_ip.setText(saved_ip)
 
     def _save_ip(self, ip_text):
+        ip_text = ip_text.strip()
+        # Connect/disconnect save the same address over and over; only write when it changed
+        if ip_text == self._last_saved_ip:
+            return
         try:
             with open(self._ip_store_path, "w", encoding="utf-8") as f:
-                f.write(ip_text.strip())
+                f.write(ip_text)
+            self._last_saved_ip = ip_text
         except Exception:
             pass
 
@@ -1065,13 +1439,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
             self._update_color_preview(key, val)
 
     def _reset_color(self, key):
-        default = {
-            "bg": config.COLOR_BG,
-            "arm": config.COLOR_BASE,
-            "wrist": config.COLOR_WRIST,
-            "eef": config.COLOR_EEF,
-            "trace": config.COLOR_PATH,
-        }[key]
+        default = self._COLOR_DEFAULTS[key]
         self.color_inputs[key].setText(default)
         self._apply_color(key)
 
@@ -1082,6 +1450,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
         name = name.strip()
         self.color_presets[name] = dict(self.color_vars)
         self._refresh_color_presets(selected=name)
+        self._persist_timer.start()
 
     def _load_color_preset(self):
         name = self.combo_color_presets.currentText()
@@ -1093,24 +1462,46 @@ class QtControlPanel(QtWidgets.QMainWindow):
                     self._apply_color(k)
 
     def _refresh_color_presets(self, selected=None):
+        if self.combo_color_presets is None:
+            return
         self.combo_color_presets.blockSignals(True)
         self.combo_color_presets.clear()
-        for key in self.color_presets.keys():
-            self.combo_color_presets.addItem(key)
-        if selected and selected in self.color_presets:
-            self.combo_color_presets.setCurrentText(selected)
-        else:
-            self.combo_color_presets.setCurrentText("Default")
+        self.combo_color_presets.addItems(list(self.color_presets.keys()))
+        target = selected if selected in self.color_presets else "Default"
+        idx = self.combo_color_presets.findText(target)
+        if idx >= 0:
+            self.combo_color_presets.setCurrentIndex(idx)
         self.combo_color_presets.blockSignals(False)
 
+    def _queue_color_preview(self, key, val):
+        self._pending_colors[key] = val
+        self._color_preview_timer.start()
+
+    def _flush_color_previews(self):
+        pending, self._pending_colors = self._pending_colors, {}
+        for key, val in pending.items():
+            self._update_color_preview(key, val)
+
     def _update_color_preview(self, key, val):
         if key not in self.color_previews:
             return
-        norm = self._normalize_color(val)
-        if not norm:
-            self.color_previews[key].setStyleSheet("background: #1d1f23; border: 1px solid #a33;")
-        else:
-            self.color_previews[key].setStyleSheet(f"background: {norm}; border: 1px solid #3c3f43;")
+        self.color_previews[key].setPixmap(self._color_swatch(self._normalize_color(val)))
+
+    def _color_swatch(self, norm):
+        """Solid swatch for a normalized color (None = invalid marker), cached per value."""
+        pixmap = self._color_pixmap_cache.get(norm)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(22, 22)
+            if norm:
+                pixmap.fill(QtGui.QColor(norm))
+            else:
+                pixmap.fill(QtGui.QColor("#1d1f23"))
+                painter = QtGui.QPainter(pixmap)
+                painter.setPen(QtGui.QColor("#aa3333"))
+                painter.drawRect(0, 0, 21, 21)
+                painter.end()
+            self._color_pixmap_cache[norm] = pixmap
+        return pixmap
 
     def _normalize_color(self, val):
         if not val:
@@ -1118,13 +1509,14 @@ class QtControlPanel(QtWidgets.QMainWindow):
         s = val.strip()
         if not s:
             return None
-        hex_chars = set("0123456789abcdefABCDEF")
-        if not s.startswith("#") and all(c in hex_chars for c in s) and len(s) in (3, 6):
-            s = "#" + s
-        color = QtGui.QColor(s)
-        if not color.isValid():
-            return None
-        return color.name()
+        # Plain (#)rgb / (#)rrggbb needs no QColor; named colors still go through Qt
+        m = _HEX_RE.fullmatch(s)
+        if m:
+            h = m.group(1).lower()
+            if len(h) == 3:
+                h = "".join(c * 2 for c in h)
+            return "#" + h
+        return _canonical_color(s)
 
     def _set_scale_mm(self, enabled):
         self.scale_mm = enabled
@@ -1178,41 +1570,39 @@ class QtControlPanel(QtWidgets.QMainWindow):
                 self._force_trace_mode("Effector Tip")
 
     def _toggle_controls(self, running):
-        stl_enabled = (len(self.stl_history) > 0) and (not running)
-        self.btn_run.setEnabled(not running and self.current_script_path is not None)
-        self.btn_browse.setEnabled(not running)
-        self.combo_history.setEnabled(not running)
-        self.btn_stop.setEnabled(running)
-        self.btn_restart.setEnabled(running)
-        self.btn_pause.setEnabled(running)
-        self.speed_slider.setEnabled(not running)
-        self.loop_chk.setEnabled(not running)
-        self.btn_load_stl.setEnabled(not running)
-        self.combo_stls.setEnabled(stl_enabled)
-        self.btn_preset_std.setEnabled(not running)
-        self.btn_preset_vac.setEnabled(not running)
-        self.btn_preset_remove.setEnabled(not running)
-
-    def _run_script_thread(self, path):
-        # Mirror Tk behavior for the xarm stub
-        if 'xarm' in sys.modules:
-            del sys.modules['xarm']
-        if 'xarm.wrapper' in sys.modules:
-            del sys.modules['xarm.wrapper']
-        xarm_mod = types.ModuleType('xarm')
-        wrap_mod = types.ModuleType('xarm.wrapper')
-
-        live_api_instance = self.api
-
-        def API_Factory(ip, **kwargs):
-            return live_api_instance
-
-        wrap_mod.XArmAPI = API_Factory
-        xarm_mod.wrapper = wrap_mod
-        sys.modules['xarm'] = xarm_mod
-        sys.modules['xarm.wrapper'] = wrap_mod
-
-        self.ctx.log_queue.put(f"--- Start: {os.path.basename(path)} ---")
+        self.setUpdatesEnabled(False)
+        try:
+            for w in self._widgets_when_idle:
+                w.setEnabled(not running)
+            for w in self._widgets_when_running:
+                w.setEnabled(running)
+            self.btn_run.setEnabled(not running and self.current_script_path is not None)
+            self.combo_stls.setEnabled(len(self.stl_history) > 0 and not running)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _install_xarm_stub(self):
+        """Make `from xarm.wrapper import XArmAPI` in user scripts return the live API (Tk behavior)."""
+        if self._xarm_stub is None:
+            xarm_mod = types.ModuleType('xarm')
+            wrap_mod = types.ModuleType('xarm.wrapper')
+
+            def API_Factory(ip, **kwargs):
+                return self.api
+
+            wrap_mod.XArmAPI = API_Factory
+            xarm_mod.wrapper = wrap_mod
+            self._xarm_stub = (xarm_mod, wrap_mod)
+        xarm_mod, wrap_mod = self._xarm_stub
+        # Built once; only re-registered if a script replaced or removed them
+        if sys.modules.get('xarm') is not xarm_mod or sys.modules.get('xarm.wrapper') is not wrap_mod:
+            sys.modules['xarm'] = xarm_mod
+            sys.modules['xarm.wrapper'] = wrap_mod
+
+    def _run_script_thread(self, path, name):
+        self._install_xarm_stub()
+
+        self.ctx.log_queue.put(f"--- Start: {name} ---")
         try:
             runpy.run_path(path, run_name="__main__")
         except SystemExit as e:
@@ -1237,8 +1627,16 @@ class QtControlPanel(QtWidgets.QMainWindow):
             QtCore.QTimer.singleShot(0, self._run_current_script)
 
     def _update_3d_loop(self):
+        self._process_queues()
+        self._flush_log()
         if not self.viz or not self.viz.plotter:
             return
+        if not (self._dirty or self.viz.scene_dirty):
+            return
+        # Nothing visible to draw into; leave the flags set so the view catches up when shown again
+        if self.isMinimized() or not self.viz_widget.isVisible():
+            return
+        self._dirty = False
         try:
             is_collision = self.viz.render_frame()
             if is_collision:
@@ -1248,9 +1646,10 @@ class QtControlPanel(QtWidgets.QMainWindow):
                     return
             else:
                 if self.was_colliding:
-                    for key, val in self.color_vars.items():
-                        if key in ["arm", "wrist", "eef"]:
-                            self.viz.set_color(key, val)
+                    for key in ("arm", "wrist", "eef"):
+                        self.viz.set_color(key, self.color_vars[key], render=False)
+                    self.viz.scene_dirty = False
+                    self.viz.plotter.render()
                     self.was_colliding = False
         except Exception:
             pass
@@ -1317,7 +1716,7 @@ class QtControlPanel(QtWidgets.QMainWindow):
                 "loop_enabled": self.loop_enabled,
             }
             with open(path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2)
+                f.write(json_dumps(payload, indent=True))
             return path
         except Exception as e:
             self._append_log(f"[ALERT] Failed to save snapshot: {e}")
@@ -1325,175 +1724,86 @@ class QtControlPanel(QtWidgets.QMainWindow):
 
     def _resume_from_crash(self):
         self.ctx.paused = False
+        self._dirty = True
         self._update_3d_loop()
 
     def _process_queues(self):
         # Logs
-        while not self.ctx.log_queue.empty():
-            try:
-                msg = self.ctx.log_queue.get_nowait()
-            except queue.Empty:
-                break
+        for msg in _drain(self.ctx.log_queue):
             if msg == "__SCRIPT_DONE__":
+                # Show the run's output before a loop restart (or its preflight dialog) kicks in
+                self._flush_log()
                 self._on_script_finished()
                 continue
             self._append_log(str(msg))
 
-        # Joint updates from API
-        latest_joints = None
-        while not self.ctx.joint_queue.empty():
+        # Joint updates from API (intermediate samples are already dropped by the deque)
+        try:
+            latest_joints = self.ctx.joint_queue.pop()
+        except IndexError:
+            latest_joints = None
+
+        # A stationary arm keeps resending the same pose; skip the viz and widget writes then
+        last = self._last_pushed_joints
+        if latest_joints is not None and last is not None and len(last) == len(latest_joints) \
+                and all(abs(a - b) < 1e-4 for a, b in zip(latest_joints, last)):
+            latest_joints = None
+
+        if latest_joints is not None:
+            self._last_pushed_joints = tuple(latest_joints)
+            self.viz.update_joints(latest_joints)
+            # One repaint of the joint panel for all twelve widgets
+            self.joints_group.setUpdatesEnabled(False)
             try:
-                latest_joints = self.ctx.joint_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        if latest_joints:
-            with self.data_lock:
-                self.viz.update_joints(latest_joints)
-            for idx, val in enumerate(latest_joints):
-                if idx < len(self.joint_spin):
-                    self.joint_spin[idx].blockSignals(True)
-                    self.joint_spin[idx].setValue(val)
-                    self.joint_spin[idx].blockSignals(False)
-                    self.joint_sliders[idx].blockSignals(True)
-                    self.joint_sliders[idx].setValue(int(val * 10))
-                    self.joint_sliders[idx].blockSignals(False)
-
-        # Update stream status indicator based on API flags
-        if hasattr(self, "api"):
-            new_state = "off"
-            if getattr(self.api, "stream_running", False):
-                new_state = "connected" if getattr(self.api, "stream_connected", False) else "listening"
-            self._set_stream_status(new_state)
-
-            # Update real-robot connection indicator
-            if hasattr(self, "btn_connect_real") and hasattr(self, "edit_robot_ip"):
-                if getattr(self.api, "is_connected", False):
-                    self._set_connection_status("connected")
-                    self.btn_connect_real.setText("Disconnect")
-                    self.btn_disconnect_real.setEnabled(True)
-                    self.edit_robot_ip.setEnabled(False)
-                else:
-                    if not self.btn_connect_real.text().startswith("Connecting"):
-                        self._set_connection_status("disconnected")
-                        self.btn_connect_real.setText("Connect to Robot")
-                        self.btn_disconnect_real.setEnabled(False)
-                        self.edit_robot_ip.setEnabled(True)
-                # keep sim-only checkbox reflecting API
-                if hasattr(self, "sim_only_chk"):
-                    self.sim_only_chk.blockSignals(True)
-                    self.sim_only_chk.setChecked(getattr(self.api, "sim_only_mode", True))
-                    self.sim_only_chk.blockSignals(False)
-
-    # Final override to keep collapsible headers plain (no state styling)
-    def _make_collapsible_old2(self, title, content_widget, expanded=True):
-        container = QtWidgets.QWidget()
-        vbox = QtWidgets.QVBoxLayout(container)
-        vbox.setContentsMargins(0, 0, 0, 0)
-        vbox.setSpacing(2)
-
-        arrow_open = "▾"
-        arrow_closed = "▸"
-        toggle = QtWidgets.QPushButton((f"{arrow_open}  " if expanded else f"{arrow_closed}  ") + title)
-        toggle.setObjectName("CollapseHeader")
-        toggle.setFlat(True)
-        toggle.setCheckable(False)
-        toggle.setAutoDefault(False)
-        toggle.setDefault(False)
-        toggle.setFocusPolicy(QtCore.Qt.NoFocus)
-        toggle.setStyleSheet("""
-            QPushButton#CollapseHeader {
-                border: none;
-                background: transparent;
-                color: #dfe3e8;
-                padding: 3px 0;
-                font-weight: 600;
-                text-align: left;
-            }
-            QPushButton#CollapseHeader:hover {
-                background: #2b2b2b;
-                color: #f08c28;
-            }
-            QPushButton#CollapseHeader:pressed {
-                background: #262626;
-                color: #f08c28;
-            }
-            QPushButton#CollapseHeader:focus { outline: none; }
-        """)
-        vbox.addWidget(toggle)
-
-        frame = QtWidgets.QFrame()
-        frame_layout = QtWidgets.QVBoxLayout(frame)
-        frame_layout.setContentsMargins(8, 4, 8, 8)
-        frame_layout.addWidget(content_widget)
-        vbox.addWidget(frame)
-
-        state = {"open": expanded}
-
-        def on_click():
-            state["open"] = not state["open"]
-            frame.setVisible(state["open"])
-            toggle.setText((f"{arrow_open}  " if state["open"] else f"{arrow_closed}  ") + title)
-
-        toggle.clicked.connect(on_click)
-        frame.setVisible(expanded)
-        return container
-
-
-    # Override collapsible header to use ASCII arrows and neutral hover
+                for spin, slider, val in zip(self.joint_spin, self.joint_sliders, latest_joints):
+                    with QtCore.QSignalBlocker(spin), QtCore.QSignalBlocker(slider):
+                        spin.setValue(val)
+                        slider.setValue(int(val * 10))
+            finally:
+                self.joints_group.setUpdatesEnabled(True)
+
+    # Collapsible section with an ASCII-arrow header; neutral hover comes from the app stylesheet
     def _make_collapsible(self, title, content_widget, expanded=True):
+        """content_widget may be a widget or a zero-arg factory that is only called on first expand."""
         container = QtWidgets.QWidget()
         vbox = QtWidgets.QVBoxLayout(container)
         vbox.setContentsMargins(0, 0, 0, 0)
         vbox.setSpacing(2)
 
-        arrow_open = "v"
-        arrow_closed = ">"
-        toggle = QtWidgets.QPushButton((f"{arrow_open} " if expanded else f"{arrow_closed} ") + title)
+        toggle = QtWidgets.QPushButton(("v " if expanded else "> ") + title)
+        # Styled by GLOBAL_QSS through its objectName, no per-widget QSS parse
         toggle.setObjectName("CollapseHeader")
         toggle.setFlat(True)
         toggle.setCheckable(False)
         toggle.setAutoDefault(False)
         toggle.setDefault(False)
         toggle.setFocusPolicy(QtCore.Qt.NoFocus)
-        toggle.setStyleSheet("""
-            QPushButton#CollapseHeader {
-                border: none;
-                background: transparent;
-                color: #dfe3e8;
-                padding: 3px 0;
-                font-weight: 600;
-                text-align: left;
-            }
-            QPushButton#CollapseHeader:hover {
-                background: transparent;
-                color: #f08c28;
-            }
-            QPushButton#CollapseHeader:pressed {
-                background: transparent;
-                color: #f08c28;
-            }
-            QPushButton#CollapseHeader:focus { outline: none; }
-        """)
         vbox.addWidget(toggle)
 
         frame = QtWidgets.QFrame()
         frame_layout = QtWidgets.QVBoxLayout(frame)
         frame_layout.setContentsMargins(8, 4, 8, 8)
-        frame_layout.addWidget(content_widget)
+        pending = [content_widget] if callable(content_widget) else []
+        if not pending:
+            frame_layout.addWidget(content_widget)
+        elif expanded:
+            frame_layout.addWidget(pending.pop()())
         vbox.addWidget(frame)
 
-        state = {"open": expanded}
-
-        def on_click():
-            state["open"] = not state["open"]
-            frame.setVisible(state["open"])
-            toggle.setText((f"{arrow_open} " if state["open"] else f"{arrow_closed} ") + title)
-
-        toggle.clicked.connect(on_click)
+        # Open state lives on the frame itself; one bound handler serves every collapsible
+        frame.setProperty("open", expanded)
+        toggle.clicked.connect(partial(self._on_collapse_clicked, toggle, frame, title, pending))
         frame.setVisible(expanded)
         return container
 
+    def _on_collapse_clicked(self, toggle, frame, title, pending, _checked=False):
+        is_open = not frame.property("open")
+        frame.setProperty("open", is_open)
+        if is_open and pending:
+            frame.layout().addWidget(pending.pop()())
+        frame.setVisible(is_open)
+        toggle.setText(("v " if is_open else "> ") + title)
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
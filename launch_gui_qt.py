@@ -9,6 +9,35 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 
 import config
 
+try:
+    import resources_rc  # noqa: F401  (generated by build.py via pyrcc5)
+    SPLASH_ICON = ":/icon_96.png"
+    SPLASH_SHADOW = ":/splash_shadow.png"
+except ImportError:
+    SPLASH_ICON = config.ICON_PATH_96 if os.path.exists(config.ICON_PATH_96) else config.ICON_PATH
+    SPLASH_SHADOW = config.SPLASH_SHADOW_PATH
+SPLASH_ICON_SIZE = 96
+
+
+_SPLASH_CARD_QSS = """
+QFrame#Card {
+    background: #181818;
+    border-radius: 12px;
+}
+QLabel#Title { font-size: 18px; font-weight: 700; color: #f08c28; }
+QLabel#Subtitle { font-size: 11px; color: #b7bcc3; }
+QProgressBar {
+    border: 1px solid #2f2f2f;
+    border-radius: 6px;
+    background: #0f0f0f;
+    height: 12px;
+}
+QProgressBar::chunk {
+    background: #f08c28;
+    border-radius: 6px;
+}
+"""
+
 
 class LoadingSplash(QtWidgets.QWidget):
     """Floating splash with soft shadow and indeterminate bar; no window frame/box."""
@@ -22,43 +51,25 @@ class LoadingSplash(QtWidgets.QWidget):
         outer = QtWidgets.QVBoxLayout(self)
         outer.setContentsMargins(16, 16, 16, 16)
 
-        # Card container with shadow
+        # Pre-blurred shadow under the card (offset 12px down), painted as a plain pixmap;
+        # a QGraphicsDropShadowEffect would re-run its blur on every repaint of the bar
+        self._shadow = QtGui.QPixmap(SPLASH_SHADOW)
+
         card = QtWidgets.QFrame()
         card.setObjectName("Card")
-        card.setStyleSheet("""
-            QFrame#Card {
-                background: #181818;
-                border-radius: 12px;
-            }
-            QLabel#Title { font-size: 18px; font-weight: 700; color: #f08c28; }
-            QLabel#Subtitle { font-size: 11px; color: #b7bcc3; }
-            QProgressBar {
-                border: 1px solid #2f2f2f;
-                border-radius: 6px;
-                background: #0f0f0f;
-                height: 12px;
-            }
-            QProgressBar::chunk {
-                background: #f08c28;
-                border-radius: 6px;
-            }
-        """)
-        shadow = QtWidgets.QGraphicsDropShadowEffect(card)
-        shadow.setBlurRadius(28)
-        shadow.setOffset(0, 12)
-        shadow.setColor(QtGui.QColor(0, 0, 0, 160))
-        card.setGraphicsEffect(shadow)
+        card.setStyleSheet(_SPLASH_CARD_QSS)
 
         inner = QtWidgets.QVBoxLayout(card)
         inner.setContentsMargins(24, 24, 24, 24)
         inner.setSpacing(12)
 
-        pixmap = QtGui.QPixmap(config.ICON_PATH)
+        pixmap = QtGui.QPixmap(SPLASH_ICON)
         if pixmap.isNull():
-            pixmap = QtGui.QPixmap(96, 96)
+            pixmap = QtGui.QPixmap(SPLASH_ICON_SIZE, SPLASH_ICON_SIZE)
             pixmap.fill(QtGui.QColor("#242424"))
-        else:
-            pixmap = pixmap.scaled(96, 96, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        elif max(pixmap.width(), pixmap.height()) != SPLASH_ICON_SIZE:
+            # Only the full-size fallback icon needs a resample
+            pixmap = pixmap.scaled(SPLASH_ICON_SIZE, SPLASH_ICON_SIZE, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
 
         icon_label = QtWidgets.QLabel()
         icon_label.setAlignment(QtCore.Qt.AlignCenter)
@@ -81,10 +92,6 @@ class LoadingSplash(QtWidgets.QWidget):
 
         outer.addWidget(card)
 
-        self._anim_timer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(lambda: None)  # keep UI pumping
-        self._anim_timer.start(100)
-
         # Center on screen
         screen = QtWidgets.QApplication.primaryScreen().availableGeometry()
         self.move(
@@ -92,6 +99,33 @@ class LoadingSplash(QtWidgets.QWidget):
             screen.center().y() - self.height() // 2,
         )
 
+    def paintEvent(self, event):
+        if not self._shadow.isNull():
+            painter = QtGui.QPainter(self)
+            painter.drawPixmap(0, 0, self._shadow)
+            painter.end()
+
+
+class _ImportSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+
+class _Importer(QtCore.QRunnable):
+    """Import the heavy gui_qt module on the thread pool so the splash keeps repainting."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _ImportSignals()
+
+    def run(self):
+        try:
+            import gui_qt
+        except BaseException as exc:
+            self.signals.failed.emit(exc)
+            return
+        self.signals.done.emit(gui_qt)
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
@@ -99,15 +133,31 @@ def main():
     splash.show()
     app.processEvents()
 
-    # Heavy imports happen after splash is visible
-    from gui_qt import QtControlPanel, apply_dark_palette
+    holder = {}
+
+    def on_failed(exc):
+        splash.close()
+        sys.excepthook(type(exc), exc, exc.__traceback__)
+        app.exit(1)
+
+    def on_imported(gui_qt):
+        # Widgets must be created on the GUI thread, so only the import runs in the pool.
+        # An exception escaping a PyQt5 slot aborts the process, so route it to on_failed.
+        try:
+            gui_qt.apply_dark_palette(app)
+            holder["win"] = gui_qt.QtControlPanel()
+            holder["win"].show()
+        except Exception as exc:
+            on_failed(exc)
+            return
+        splash.close()
 
-    apply_dark_palette(app)
-    win = QtControlPanel()
-    win.show()
-    splash.close()
+    # Heavy imports happen after splash is visible
+    importer = _Importer()
+    importer.signals.done.connect(on_imported)
+    importer.signals.failed.connect(on_failed)
+    QtCore.QThreadPool.globalInstance().start(importer)
     sys.exit(app.exec_())
 
-
 if __name__ == "__main__":
     main()
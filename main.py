@@ -3,7 +3,6 @@ import sys
 import tkinter as tk
 from tkinter import ttk
 import threading
-import time
 
 # Crash prevention
 os.environ["OMP_NUM_THREADS"] = "1"
@@ -77,8 +76,7 @@ class SplashScreen(tk.Tk):
 
     def _load_heavy_modules(self):
         try:
-            # Base imports
-            time.sleep(1.0) # Short delay for UX
+            # Heavy imports happen here, behind the already-painted splash
             self.after(0, lambda: self._update_status("Loading 3D Engine...", 20))
             
             import pyvista 
@@ -98,8 +96,6 @@ class SplashScreen(tk.Tk):
             except ImportError:
                 pass
 
-            time.sleep(1.0) # Short delay for UX
-            
             # GUI
             self.after(0, lambda: self._update_status("Building User Interface...", 80))
             from gui import ControlPanel
@@ -107,8 +103,6 @@ class SplashScreen(tk.Tk):
             self.app_class = ControlPanel
             
             self.after(0, lambda: self._update_status("Ready!", 100))
-            time.sleep(1.0)
-            
             self.after(0, self._launch_app)
             
         except Exception as e:
@@ -3,8 +3,8 @@ import time
 import math
 import sys
 import socket
+import selectors
 import threading
-import json
 
 try:
     from xarm.wrapper import XArmAPI as RealXArmAPI
@@ -13,7 +13,7 @@ except ImportError:
     HAS_REAL_SDK = False
 
 import config
-from utils import normalize_angles, rpy_to_matrix
+from utils import normalize_angles, rpy_to_matrix, json_loads
 
 GLOBAL_API_INSTANCE = None
 
@@ -33,6 +33,23 @@ class SimXArmAPI:
         self.stream_thread = None
         self.stream_running = False
         self.stream_connected = False
+        # Optional callable(name, value) fired when a status flag flips; called from worker
+        # threads, so GUI callers must marshal it to their own thread
+        self.on_state_change = None
+        self._real_conn_cb = None
+
+    def _notify_state(self, name, value):
+        cb = self.on_state_change
+        if cb:
+            try:
+                cb(name, value)
+            except Exception:
+                pass
+
+    def _set_flag(self, name, value):
+        if getattr(self, name) != value:
+            setattr(self, name, value)
+            self._notify_state(name, value)
 
     def _clamp(self, n, minn, maxn):
         return max(min(maxn, n), minn)
@@ -61,7 +78,14 @@ class SimXArmAPI:
                 self.real_arm.motion_enable(True)
                 self.real_arm.set_mode(0)
                 self.real_arm.set_state(0)
+                # SDK reports cable pulls / controller resets without us polling .connected
+                self._real_conn_cb = lambda data: self._notify_state("is_connected", bool(data.get("connected")))
+                try:
+                    self.real_arm.register_connect_changed_callback(self._real_conn_cb)
+                except Exception:
+                    self._real_conn_cb = None
                 self._log("[REAL] Connected successfully!")
+                self._notify_state("is_connected", True)
                 return True, "Connected"
             else:
                 self.real_arm = None
@@ -75,11 +99,18 @@ class SimXArmAPI:
     def disconnect_real_robot(self):
         # GUI uses to disconnect real Lite 6
         if self.real_arm:
+            if self._real_conn_cb:
+                try:
+                    self.real_arm.release_connect_changed_callback(self._real_conn_cb)
+                except Exception:
+                    pass
+                self._real_conn_cb = None
             try: 
                 self.real_arm.disconnect()
             except: pass
             self.real_arm = None
             self._log("[REAL] Disconnected manually/on-exit.")
+            self._notify_state("is_connected", False)
 
     # Ignoring disconnecting and connecting to robot because GUI will handle the connection/disconnection
     def disconnect(self): 
@@ -100,7 +131,8 @@ class SimXArmAPI:
     def _log(self, msg): self.ctx.log_queue.put(msg)
     
     def _update_gui(self): 
-        self.ctx.joint_queue.put(list(self.joints_deg))
+        # deque.append is atomic under the GIL; maxlen=1 drops the stale sample
+        self.ctx.joint_queue.append(list(self.joints_deg))
 
     def _check_controls(self):
         if self.ctx.stop_flag:
@@ -332,41 +364,89 @@ class SimXArmAPI:
             self._log("[STREAM] Listener already running")
             return
 
+        def handle_line(line):
+            try:
+                msg = json_loads(line)
+                joints = msg.get("joints_deg")
+                if joints and len(joints) == config.JOINT_COUNT:
+                    self.set_servo_angle(joints, wait=False)
+            except Exception as e:
+                self._log(f"[STREAM] Parse error: {e}")
+
+        def drop_client(sel, conn):
+            sel.unregister(conn)
+            try:
+                conn.close()
+            except Exception:
+                pass
+            self._log("[STREAM] Client disconnected")
+            # Only the listening socket left -> no client attached
+            self._set_flag("stream_connected", len(sel.get_map()) > 1)
+
+        def read_client(sel, key):
+            conn, buf = key.fileobj, key.data
+            try:
+                chunk = conn.recv(4096)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                self._log(f"[STREAM] Connection error: {e}")
+                chunk = b""
+            if not chunk:
+                drop_client(sel, conn)
+                return
+            buf += chunk
+            while True:
+                nl = buf.find(b"\n")
+                if nl < 0:
+                    break
+                line = bytes(buf[:nl]).strip()
+                del buf[:nl + 1]
+                if line:
+                    handle_line(line)
+
         def worker():
-            self.stream_connected = False
+            self._set_flag("stream_connected", False)
             srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            srv.bind((host, port))
-            srv.listen(1)
-            self._log(f"[STREAM] Listening for joint stream on {host}:{port}...")
-            self.stream_running = True
-            while self.stream_running:
-                conn, addr = srv.accept()
-                self._log(f"[STREAM] Client connected: {addr}")
-                self.stream_connected = True
-                try:
-                    with conn, conn.makefile("r") as f:
-                        for line in f:
-                            if not self.stream_running:
-                                break
-                            line = line.strip()
-                            if not line:
-                                continue
-                            try:
-                                msg = json.loads(line)
-                                joints = msg.get("joints_deg")
-                                if joints and len(joints) == config.JOINT_COUNT:
-                                    self.set_servo_angle(joints, wait=False)
-                            except Exception as e:
-                                self._log(f"[STREAM] Parse error: {e}")
-                except Exception as e:
-                    self._log(f"[STREAM] Connection error: {e}")
-                self._log("[STREAM] Client disconnected")
-                self.stream_connected = False
             try:
+                srv.bind((host, port))
+                srv.listen(1)
+            except OSError as e:
                 srv.close()
-            except Exception:
-                pass
+                self._log(f"[STREAM] Could not listen on {host}:{port}: {e}")
+                # Never went up; still tell the GUI so an optimistic "listening" gets corrected
+                self._notify_state("stream_running", False)
+                return
+            srv.setblocking(False)
+            # One thread multiplexes accept + reads; the select timeout lets stop requests land
+            sel = selectors.DefaultSelector()
+            sel.register(srv, selectors.EVENT_READ, data=None)
+            self._log(f"[STREAM] Listening for joint stream on {host}:{port}...")
+            self._set_flag("stream_running", True)
+            try:
+                while self.stream_running:
+                    for key, _ in sel.select(timeout=0.2):
+                        if key.data is None:
+                            try:
+                                conn, addr = srv.accept()
+                            except (BlockingIOError, InterruptedError):
+                                continue
+                            conn.setblocking(False)
+                            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                            sel.register(conn, selectors.EVENT_READ, data=bytearray())
+                            self._log(f"[STREAM] Client connected: {addr}")
+                            self._set_flag("stream_connected", True)
+                        else:
+                            read_client(sel, key)
+            finally:
+                for key in list(sel.get_map().values()):
+                    try:
+                        key.fileobj.close()
+                    except Exception:
+                        pass
+                sel.close()
+                self._set_flag("stream_connected", False)
 
         self.stream_thread = threading.Thread(target=worker, daemon=True)
         self.stream_thread.start()
@@ -375,11 +455,11 @@ class SimXArmAPI:
         """Stop the background joint stream listener."""
         if not self.stream_running:
             return
-        self.stream_running = False
-        self.stream_connected = False
+        self._set_flag("stream_running", False)
+        self._set_flag("stream_connected", False)
         self._log("[STREAM] Listener stop requested")
 
     # Sim-only safety toggle
     def set_sim_only(self, enabled: bool):
-        self.sim_only_mode = bool(enabled)
+        self._set_flag("sim_only_mode", bool(enabled))
         self._log(f"[REAL] Sim-only mode {'ON' if self.sim_only_mode else 'OFF'}")
@@ -1,8 +1,29 @@
 # utils.py
 import math
+import json
+import importlib.util
 import numpy as np
 import queue
 
+# Optional faster JSON codec; the stdlib module is used when it is missing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# Optional JIT for batched pose math; only looked up here, imported on first batch call
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Optional compiled scalar helpers (cythonize -i _utils_ext.pyx); the definitions below are used when it is missing
+try:
+    import _utils_ext
+    HAS_UTILS_EXT = True
+except ImportError:
+    _utils_ext = None
+    HAS_UTILS_EXT = False
+
 class QueueRedirector:
     def __init__(self, q):
         self.q = q
@@ -10,19 +31,94 @@ class QueueRedirector:
         self.q.put(string)
     def flush(self): pass
 
+def json_loads(data):
+    """Decode JSON from str or bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent=False):
+    """Encode obj as a JSON str (2-space indent if requested); numpy scalars are accepted."""
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None)
+
 def normalize_angles(angles_deg):
-    normalized = []
-    for a in angles_deg:
-        a = (a + 180) % 360 - 180
-        normalized.append(a)
-    return normalized
+    """Wrap angles into [-180, 180). Arrays come back as arrays, any other sequence as a list."""
+    arr = np.asarray(angles_deg, dtype=np.float64)
+    wrapped = (arr + 180.0) % 360.0 - 180.0
+    if isinstance(angles_deg, np.ndarray):
+        return wrapped
+    return wrapped.tolist()
 
 def rpy_to_matrix(roll, pitch, yaw):
+    """Rz(yaw) @ Ry(pitch) @ Rx(roll) for angles in degrees, written out in closed form."""
     alpha, beta, gamma = math.radians(roll), math.radians(pitch), math.radians(yaw)
     ca, sa = math.cos(alpha), math.sin(alpha)
     cb, sb = math.cos(beta), math.sin(beta)
     cg, sg = math.cos(gamma), math.sin(gamma)
-    Rx = np.array([[1, 0, 0], [0, ca, -sa], [0, sa, ca]])
-    Ry = np.array([[cb, 0, sb], [0, 1, 0], [-sb, 0, cb]])
-    Rz = np.array([[cg, -sg, 0], [sg, cg, 0], [0, 0, 1]])
-    return Rz @ Ry @ Rx
\ No newline at end of file
+    M = np.empty((3, 3))
+    M[0, 0] = cg * cb
+    M[0, 1] = cg * sb * sa - sg * ca
+    M[0, 2] = cg * sb * ca + sg * sa
+    M[1, 0] = sg * cb
+    M[1, 1] = sg * sb * sa + cg * ca
+    M[1, 2] = sg * sb * ca - cg * sa
+    M[2, 0] = -sb
+    M[2, 1] = cb * sa
+    M[2, 2] = cb * ca
+    return M
+
+if HAS_UTILS_EXT:
+    normalize_angles = _utils_ext.normalize_angles
+    rpy_to_matrix = _utils_ext.rpy_to_matrix
+
+def rpy_to_matrix_batch(rpy_deg):
+    """Vectorized rpy_to_matrix: (N, 3) roll/pitch/yaw in degrees -> (N, 3, 3) rotations."""
+    rpy = np.radians(np.asarray(rpy_deg, dtype=np.float64).reshape(-1, 3))
+    if HAS_NUMBA:
+        out = np.empty((rpy.shape[0], 3, 3))
+        _get_rpy_batch_kernel()(np.ascontiguousarray(rpy), out)
+        return out
+    ca, cb, cg = np.cos(rpy).T
+    sa, sb, sg = np.sin(rpy).T
+    out = np.empty((rpy.shape[0], 3, 3))
+    out[:, 0, 0] = cg * cb
+    out[:, 0, 1] = cg * sb * sa - sg * ca
+    out[:, 0, 2] = cg * sb * ca + sg * sa
+    out[:, 1, 0] = sg * cb
+    out[:, 1, 1] = sg * sb * sa + cg * ca
+    out[:, 1, 2] = sg * sb * ca - cg * sa
+    out[:, 2, 0] = -sb
+    out[:, 2, 1] = cb * sa
+    out[:, 2, 2] = cb * ca
+    return out
+
+# Plain-Python body of the numba kernel; prange is swapped for numba's when it is compiled
+prange = range
+_rpy_batch_kernel = None
+
+def _rpy_batch_body(rpy, out):
+    for i in prange(rpy.shape[0]):
+        ca, sa = np.cos(rpy[i, 0]), np.sin(rpy[i, 0])
+        cb, sb = np.cos(rpy[i, 1]), np.sin(rpy[i, 1])
+        cg, sg = np.cos(rpy[i, 2]), np.sin(rpy[i, 2])
+        out[i, 0, 0] = cg * cb
+        out[i, 0, 1] = cg * sb * sa - sg * ca
+        out[i, 0, 2] = cg * sb * ca + sg * sa
+        out[i, 1, 0] = sg * cb
+        out[i, 1, 1] = sg * sb * sa + cg * ca
+        out[i, 1, 2] = sg * sb * ca - cg * sa
+        out[i, 2, 0] = -sb
+        out[i, 2, 1] = cb * sa
+        out[i, 2, 2] = cb * ca
+
+def _get_rpy_batch_kernel():
+    """Import numba and compile (or load from its disk cache) the batch kernel on first use."""
+    global _rpy_batch_kernel, prange
+    if _rpy_batch_kernel is None:
+        import numba
+        prange = numba.prange
+        _rpy_batch_kernel = numba.njit(cache=True, fastmath=True, parallel=True)(_rpy_batch_body)
+    return _rpy_batch_kernel
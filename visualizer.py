@@ -1,9 +1,12 @@
 # visualizer.py
 import os
 import math
+import mmap
+import struct
 import numpy as np
 import traceback
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 import config
 
 try:
@@ -11,6 +14,7 @@ try:
     # PyVista settings
     pv.global_theme.allow_empty_mesh = True
     from ikpy.chain import Chain
+    from vtkmodules.vtkCommonMath import vtkMatrix4x4
     try:
         from vtkmodules.tk.vtkTkRenderWindowInteractor import vtkTkRenderWindowInteractor
     except Exception:
@@ -18,6 +22,50 @@ try:
 except ImportError as e:
     print(f"CRITICAL: Module missing in Visualizer: {e}")
 
+# Binary STL record: normal, three vertices, attribute byte count (50 bytes, little endian)
+STL_TRIANGLE_DTYPE = np.dtype([("normal", "<f4", (3,)), ("v", "<f4", (3, 3)), ("attr", "<u2")])
+
+def read_stl(path):
+    """Read an STL into PolyData. Binary files are parsed in one vectorized pass over an mmap;
+    anything else (ASCII, truncated files) falls back to pv.read."""
+    with open(path, "rb") as f:
+        f.seek(80)
+        header = f.read(4)
+        n_tris = struct.unpack("<I", header)[0] if len(header) == 4 else 0
+        is_binary = n_tris > 0 and os.fstat(f.fileno()).st_size == 84 + n_tris * STL_TRIANGLE_DTYPE.itemsize
+        if is_binary:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if not is_binary:
+        return pv.read(path)
+
+    tris = None
+    try:
+        tris = np.frombuffer(mm, dtype=STL_TRIANGLE_DTYPE, count=n_tris, offset=84)
+        # Merge shared vertices (like vtkSTLReader) so smooth shading has connectivity
+        points, inverse = np.unique(tris["v"].reshape(-1, 3), axis=0, return_inverse=True)
+    finally:
+        tris = None  # release the buffer view before unmapping
+        mm.close()
+    faces = np.empty((n_tris, 4), dtype=np.int64)
+    faces[:, 0] = 3
+    faces[:, 1:] = inverse.reshape(-1, 3)
+    return pv.PolyData(points, faces.ravel())
+
+@lru_cache(maxsize=32)
+def _load_mesh_cached(path, mtime_ns, size, scale_to_meters):
+    mesh = read_stl(path)
+    if scale_to_meters:
+        mesh.scale([0.001, 0.001, 0.001], inplace=True)
+    if mesh.n_points > 0:
+        mesh = mesh.compute_normals(cell_normals=False, point_normals=True, split_vertices=True, feature_angle=30.0)
+    return mesh
+
+def load_mesh(path, scale_to_meters=False):
+    """Load a display-ready STL mesh. Repeat loads of an unchanged file (same mtime/size)
+    return the same PolyData, so callers must treat it as read-only."""
+    st = os.stat(path)
+    return _load_mesh_cached(path, st.st_mtime_ns, st.st_size, bool(scale_to_meters))
+
 class RobotVisualizer:
     def __init__(self):
         self.current_joints = [0.0] * config.JOINT_COUNT
@@ -38,6 +86,8 @@ class RobotVisualizer:
         self.trace_source = 'wrist' 
         self.eef_offset_z = 0.0     
         self.is_in_collision_state = False
+        self._pose_slots = []     # (link index, actor, persistent vtkMatrix4x4)
+        self.scene_dirty = True   # set by every mutator below; cleared when a frame is rendered
     
     def get_urdf_path(self):
         if not os.path.exists(config.MODEL_DIR):
@@ -118,9 +168,7 @@ class RobotVisualizer:
                 stl_path = self.get_mesh_path(expected_stl)
                 if os.path.exists(stl_path):
                     try: 
-                        mesh = pv.read(stl_path)
-                        if mesh.n_points > 0:
-                            mesh = mesh.compute_normals(cell_normals=False, point_normals=True, split_vertices=True, feature_angle=30.0)
+                        mesh = load_mesh(stl_path)
                     except: pass
                 else:
                     print(f"   [!] NOT FOUND: {expected_stl} in {config.VISUAL_DIR}")
@@ -138,6 +186,14 @@ class RobotVisualizer:
             
             if is_end_effector:
                 self.ee_actor = actor
+            else:
+                # Link geometry never changes, only its transform; skip pipeline re-execution
+                actor.mapper.SetStatic(True)
+
+            # Each actor keeps one matrix that update_pose overwrites in place
+            vmat = vtkMatrix4x4()
+            actor.SetUserMatrix(vmat)
+            self._pose_slots.append((i, actor, vmat))
         print("-" * 30)
         
         floor = pv.Plane(center=(0, 0, 0), direction=(0, 0, 1), i_size=1, j_size=1, i_resolution=20, j_resolution=20)
@@ -230,22 +286,19 @@ class RobotVisualizer:
             return False
 
         try:
-            new_mesh = pv.read(stl_path)
-            
             # Model scaling
             if scale_to_meters:
                 print("[GUI] Scaling from mm to meters (x0.001)")
-                new_mesh.scale([0.001, 0.001, 0.001], inplace=True)
-
-            if new_mesh.n_points > 0:
-                new_mesh = new_mesh.compute_normals(cell_normals=False, point_normals=True, split_vertices=True, feature_angle=30.0)
+            new_mesh = load_mesh(stl_path, scale_to_meters)
             
             # Calculate effector height
             self.eef_offset_z = new_mesh.bounds[5] 
             print(f"[GUI] EEF Length calculated: {self.eef_offset_z:.4f}m")
 
-            # Replace data in current actor
-            self.ee_actor.mapper.dataset = new_mesh
+            # Re-selecting the active, unchanged file yields the same cached mesh: nothing to swap
+            if self.ee_actor.mapper.dataset is not new_mesh:
+                self.ee_actor.mapper.dataset = new_mesh
+                self.scene_dirty = True
             
             print(f"[GUI] Gripper replaced by: {os.path.basename(stl_path)}")
             return True
@@ -261,6 +314,7 @@ class RobotVisualizer:
         try:
             empty_mesh = pv.PolyData()
             self.ee_actor.mapper.dataset = empty_mesh
+            self.scene_dirty = True
             return True
         except Exception as e:
             print(f"[GUI] Error removing gripper: {e}")
@@ -268,6 +322,14 @@ class RobotVisualizer:
 
     def update_joints(self, joints):
         self.current_joints = joints
+        self.scene_dirty = True
+
+    def update_pose(self, matrices):
+        """Apply stacked (N, 4, 4) world transforms to the link actors in a single pass."""
+        n = len(matrices)
+        for i, _actor, vmat in self._pose_slots:
+            if i < n:
+                vmat.DeepCopy(matrices[i].ravel().tolist())
 
     def reset_camera_view(self):
         if self.plotter:
@@ -308,44 +370,34 @@ class RobotVisualizer:
                     target_vector[i] = math.radians(deg)
                     joint_idx += 1
             
-            matrices = self.chain.forward_kinematics(target_vector, full_kinematics=True)
+            # All link transforms as one (N, 4, 4) stack, base offset applied in one vectorized step
+            poses = np.array(self.chain.forward_kinematics(target_vector, full_kinematics=True), dtype=float)
+            poses[:, 2, 3] += config.ROBOT_Z_OFFSET
+            self.update_pose(poses)
+
             current_ee_pos = None
-            
             current_collision = False
             COLLISION_THRESHOLD = 0.009 
 
-            for i, matrix in enumerate(matrices):
-                if i == len(matrices) - 1:
-                    wrist_x = matrix[0, 3]
-                    wrist_y = matrix[1, 3]
-                    wrist_z = matrix[2, 3] + config.ROBOT_Z_OFFSET
-
-                    if wrist_z < COLLISION_THRESHOLD: current_collision = True
-
-                    if 'tip' in self.trace_source.lower() and hasattr(self, 'eef_offset_z') and self.eef_offset_z > 0:
-                        rot_matrix = matrix[:3, :3]
-                        local_offset = np.array([0.0, 0.0, self.eef_offset_z])
-                        world_offset = rot_matrix @ local_offset
-                        current_ee_pos = [wrist_x + world_offset[0], wrist_y + world_offset[1], wrist_z + world_offset[2]]
-                        
-                        if current_ee_pos[2] < COLLISION_THRESHOLD: current_collision = True
-                    else:
-                        current_ee_pos = [wrist_x, wrist_y, wrist_z]
-
-                if i < len(self.link_map):
-                    actor = self.link_map[i]
-                    if actor is not None:
-                        mat_copy = matrix.copy()
-                        mat_copy[2, 3] += config.ROBOT_Z_OFFSET
-                        actor.user_matrix = mat_copy 
+            wrist = poses[-1]
+            wrist_x, wrist_y, wrist_z = wrist[0, 3], wrist[1, 3], wrist[2, 3]
+            if wrist_z < COLLISION_THRESHOLD: current_collision = True
+
+            if 'tip' in self.trace_source.lower() and hasattr(self, 'eef_offset_z') and self.eef_offset_z > 0:
+                world_offset = wrist[:3, 2] * self.eef_offset_z
+                current_ee_pos = [wrist_x + world_offset[0], wrist_y + world_offset[1], wrist_z + world_offset[2]]
+                
+                if current_ee_pos[2] < COLLISION_THRESHOLD: current_collision = True
+            else:
+                current_ee_pos = [wrist_x, wrist_y, wrist_z]
             
             if current_collision:
                 if not self.is_in_collision_state:
-                    self.set_color("arm", config.COLOR_COLLISION)
-                    self.set_color("wrist", config.COLOR_COLLISION)
-                    self.set_color("eef", config.COLOR_COLLISION)
+                    for target in ("arm", "wrist", "eef"):
+                        self.set_color(target, config.COLOR_COLLISION, render=False)
                     self.is_in_collision_state = True
                 
+                self.scene_dirty = False
                 self.plotter.render()
                 return True 
 
@@ -363,17 +415,22 @@ class RobotVisualizer:
                     self.trace_points.append(current_ee_pos)
                     self.last_trace_pos = current_ee_pos
                     if len(self.trace_points) > 1:
-                        if self.trace_actor: self.plotter.remove_actor(self.trace_actor)
                         points_array = np.array(self.trace_points)
                         line_mesh = pv.lines_from_points(points_array)
-                        self.trace_actor = self.plotter.add_mesh(line_mesh, color=self.trace_color, line_width=4, reset_camera=False)
+                        # Swap the polyline into the existing actor instead of rebuilding it per point
+                        if self.trace_actor is None:
+                            self.trace_actor = self.plotter.add_mesh(line_mesh, color=self.trace_color, line_width=4, reset_camera=False)
+                        else:
+                            self.trace_actor.mapper.dataset = line_mesh
             
+            self.scene_dirty = False
             self.plotter.render() 
             return False
 
         except Exception: return False
 
-    def set_color(self, target, color_hex):
+    def set_color(self, target, color_hex, render=True):
+        """Recolor actors in place (property only, no actor rebuild). Pass render=False to batch."""
         if not self.plotter: return False
 
         if len(color_hex) == 6 and all(c in '0123456789ABCDEFabcdef' for c in color_hex):
@@ -392,12 +449,14 @@ class RobotVisualizer:
                 self.trace_color = color_hex 
                 if self.trace_actor: self.trace_actor.prop.color = color_hex
 
-            if target != 'bg': self.plotter.render()
+            self.scene_dirty = True
+            if render and target != 'bg': self.plotter.render()
             return True
         except: return False
         
     def set_trace_enable(self, enable):
         self.trace_enabled = enable
+        self.scene_dirty = True
         if not enable:
             self.clear_trace()
             pass
@@ -405,6 +464,7 @@ class RobotVisualizer:
     def clear_trace(self):
         self.trace_points = []
         self.last_trace_pos = None
+        self.scene_dirty = True
         if self.trace_actor:
             self.plotter.remove_actor(self.trace_actor)
             self.trace_actor = None
@@ -429,6 +489,7 @@ class RobotVisualizer:
             
             if self.ee_actor:
                 self.ee_actor.prop.opacity = opacity_eef
+            self.scene_dirty = True
             
             self.plotter.render()
         except Exception as e: